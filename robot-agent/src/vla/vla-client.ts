@@ -88,6 +88,9 @@ interface ProtoActionChunk {
   model_version: string;
   confidence: number;
   sequence_number: number;
+  /** int8 joint trajectory (actions x joints); set when the server quantizes */
+  joints_q8?: Buffer;
+  joint_scale?: number;
 }
 
 interface ProtoModelInfo {
@@ -181,8 +184,9 @@ export class VLAClient extends EventEmitter {
       this._state = 'connecting';
 
       // Load proto definition
+      // keepCase: the Proto* interfaces below use the .proto snake_case names
       const packageDefinition = await protoLoader.load(PROTO_PATH, {
-        keepCase: false,
+        keepCase: true,
         longs: String,
         enums: String,
         defaults: true,
@@ -614,10 +618,16 @@ export class VLAClient extends EventEmitter {
    * Convert from proto action chunk.
    */
   private fromProtoActionChunk(proto: ProtoActionChunk): ActionChunk {
+    const quantizedJoints = this.decodeQuantizedJoints(proto);
     return {
-      actions: (proto.actions || []).map((a) => ({
-        // Ensure jointCommands is always an array (proto defaults may return undefined)
-        jointCommands: Array.isArray(a.joint_commands) ? a.joint_commands : [],
+      actions: (proto.actions || []).map((a, i) => ({
+        // Quantized chunks leave joint_commands empty; otherwise ensure
+        // jointCommands is always an array (proto defaults may return undefined)
+        jointCommands: quantizedJoints
+          ? quantizedJoints[i]
+          : Array.isArray(a.joint_commands)
+            ? a.joint_commands
+            : [],
         gripperCommand: typeof a.gripper_command === 'number' ? a.gripper_command : 0.5,
         timestamp: a.timestamp || Date.now() / 1000,
       })),
@@ -628,6 +638,32 @@ export class VLAClient extends EventEmitter {
     };
   }
 
+  /**
+   * Decode the int8 joint trajectory (joints_q8 * joint_scale), if present.
+   * Returns one row of joint commands per action, or null when the chunk
+   * carries plain joint_commands.
+   */
+  private decodeQuantizedJoints(proto: ProtoActionChunk): number[][] | null {
+    const q8 = proto.joints_q8;
+    const numActions = proto.actions?.length ?? 0;
+    if (!q8 || q8.length === 0 || numActions === 0) {
+      return null;
+    }
+
+    const values = new Int8Array(q8.buffer, q8.byteOffset, q8.length);
+    const scale = proto.joint_scale ?? 0;
+    const numJoints = values.length / numActions;
+    const rows: number[][] = [];
+    for (let i = 0; i < numActions; i++) {
+      const row = new Array<number>(numJoints);
+      for (let j = 0; j < numJoints; j++) {
+        row[j] = values[i * numJoints + j] * scale;
+      }
+      rows.push(row);
+    }
+    return rows;
+  }
+
   /**
    * Convert from proto model info.
    */
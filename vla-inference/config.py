@@ -5,19 +5,77 @@
 """
 
 import os
+import re
 import logging
-from dataclasses import dataclass, field
-from typing import Optional, List
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Accepted values for validation, built once at import
+VALID_MODELS = frozenset({"pi0", "pi0_6", "openvla", "groot"})
+# cpu, cuda or cuda:N; [0-9] rather than \d so only ASCII digits pass
+_VALID_DEVICE = re.compile(r"cpu|cuda(?::[0-9]+)?")
 
-@dataclass
+
+def _parse_bool(value: str) -> bool:
+    """Parse a "true"/"false" environment flag."""
+    return value.lower() == "true"
+
+
+# (field_name, env_key, caster, typed default) for every VLAConfig field
+_ENV_FIELDS = (
+    ("model_type", "VLA_MODEL_TYPE", str, "pi0"),
+    ("model_path", "VLA_MODEL_PATH", str, None),
+    ("device", "VLA_DEVICE", str, "cpu"),
+    ("batch_size", "VLA_BATCH_SIZE", int, 1),
+    ("max_batch_wait_ms", "VLA_MAX_BATCH_WAIT_MS", int, 10),
+    ("timeout_ms", "VLA_TIMEOUT_MS", int, 5000),
+    ("image_width", "VLA_IMAGE_WIDTH", int, 224),
+    ("image_height", "VLA_IMAGE_HEIGHT", int, 224),
+    ("action_dim", "VLA_ACTION_DIM", int, 7),
+    ("chunk_size", "VLA_CHUNK_SIZE", int, 16),
+    ("quantize_actions", "VLA_QUANTIZE_ACTIONS", _parse_bool, False),
+    ("grpc_port", "VLA_GRPC_PORT", int, 50051),
+    ("max_workers", "VLA_MAX_WORKERS", int, 4),
+    ("workers", "VLA_WORKERS", int, 1),
+    ("max_message_size_mb", "VLA_MAX_MESSAGE_SIZE_MB", int, 16),
+    ("grpc_compression", "VLA_GRPC_COMPRESSION", _parse_bool, True),
+    ("health_check_interval_s", "VLA_HEALTH_CHECK_INTERVAL_S", int, 30),
+    ("metrics_enabled", "VLA_METRICS_ENABLED", _parse_bool, True),
+    ("metrics_port", "VLA_METRICS_PORT", int, 9090),
+)
+
+
+# Startup banner for VLAConfig.log_config(), built once at import
+_CFG_RULE = "=" * 60
+_CFG_LINES = (
+    _CFG_RULE,
+    "VLA Inference Server Configuration",
+    _CFG_RULE,
+    "  Model Type:     {model_type}",
+    "  Model Path:     {model_path}",
+    "  Device:         {device}",
+    "  Batch Size:     {batch_size}",
+    "  Chunk Size:     {chunk_size}",
+    "  gRPC Port:      {grpc_port}",
+    "  Max Workers:    {max_workers}",
+    "  Processes:      {workers}",
+    "  Metrics:        {metrics_enabled}",
+)
+_CFG_TEMPLATE = "\n".join((*_CFG_LINES, _CFG_RULE))
+_CFG_TEMPLATE_WITH_METRICS_PORT = "\n".join(
+    (*_CFG_LINES, "  Metrics Port:   {metrics_port}", _CFG_RULE)
+)
+
+
+@dataclass(frozen=True, slots=True)
 class VLAConfig:
     """
     Configuration for VLA inference server.
     
-    All values can be overridden via environment variables.
+    All values can be overridden via environment variables. Instances
+    are immutable; use dataclasses.replace() to derive a modified copy.
     """
     
     # Model selection
@@ -39,11 +97,14 @@ class VLAConfig:
     # Action configuration
     action_dim: int = 7
     chunk_size: int = 16
+    quantize_actions: bool = False
     
     # Server settings
     grpc_port: int = 50051
     max_workers: int = 4
+    workers: int = 1
     max_message_size_mb: int = 16
+    grpc_compression: bool = True
     
     # Health check
     health_check_interval_s: int = 30
@@ -68,31 +129,22 @@ class VLAConfig:
             VLA_IMAGE_HEIGHT: Expected input image height
             VLA_ACTION_DIM: Action space dimensionality
             VLA_CHUNK_SIZE: Actions per chunk
+            VLA_QUANTIZE_ACTIONS: Send joint commands as int8 (joints_q8)
             VLA_GRPC_PORT: gRPC server port
             VLA_MAX_WORKERS: gRPC worker threads
+            VLA_WORKERS: Server processes sharing the gRPC port
             VLA_MAX_MESSAGE_SIZE_MB: Max gRPC message size
+            VLA_GRPC_COMPRESSION: Gzip-compress responses (level: low)
             VLA_HEALTH_CHECK_INTERVAL_S: Health check interval
             VLA_METRICS_ENABLED: Enable Prometheus metrics
             VLA_METRICS_PORT: Prometheus metrics port
         """
-        config = cls(
-            model_type=os.getenv("VLA_MODEL_TYPE", "pi0"),
-            model_path=os.getenv("VLA_MODEL_PATH"),
-            device=os.getenv("VLA_DEVICE", "cpu"),
-            batch_size=int(os.getenv("VLA_BATCH_SIZE", "1")),
-            max_batch_wait_ms=int(os.getenv("VLA_MAX_BATCH_WAIT_MS", "10")),
-            timeout_ms=int(os.getenv("VLA_TIMEOUT_MS", "5000")),
-            image_width=int(os.getenv("VLA_IMAGE_WIDTH", "224")),
-            image_height=int(os.getenv("VLA_IMAGE_HEIGHT", "224")),
-            action_dim=int(os.getenv("VLA_ACTION_DIM", "7")),
-            chunk_size=int(os.getenv("VLA_CHUNK_SIZE", "16")),
-            grpc_port=int(os.getenv("VLA_GRPC_PORT", "50051")),
-            max_workers=int(os.getenv("VLA_MAX_WORKERS", "4")),
-            max_message_size_mb=int(os.getenv("VLA_MAX_MESSAGE_SIZE_MB", "16")),
-            health_check_interval_s=int(os.getenv("VLA_HEALTH_CHECK_INTERVAL_S", "30")),
-            metrics_enabled=os.getenv("VLA_METRICS_ENABLED", "true").lower() == "true",
-            metrics_port=int(os.getenv("VLA_METRICS_PORT", "9090")),
-        )
+        env = os.environ
+        values: Dict[str, Any] = {
+            name: cast(env[key]) if key in env else default
+            for name, key, cast, default in _ENV_FIELDS
+        }
+        config = cls(**values)
         
         logger.info(f"Loaded configuration: {config}")
         return config
@@ -106,12 +158,12 @@ class VLAConfig:
         """
         errors = []
         
-        valid_models = ["pi0", "pi0_6", "openvla", "groot"]
-        if self.model_type.lower() not in valid_models:
-            errors.append(f"Invalid model_type: {self.model_type}. Valid: {valid_models}")
+        if self.model_type.lower() not in VALID_MODELS:
+            errors.append(
+                f"Invalid model_type: {self.model_type}. Valid: {sorted(VALID_MODELS)}"
+            )
             
-        valid_devices = ["cpu", "cuda"] + [f"cuda:{i}" for i in range(8)]
-        if self.device not in valid_devices:
+        if not _VALID_DEVICE.fullmatch(self.device):
             errors.append(f"Invalid device: {self.device}. Valid: cpu, cuda, cuda:N")
             
         if self.batch_size < 1:
@@ -123,43 +175,47 @@ class VLAConfig:
         if self.max_workers < 1:
             errors.append(f"max_workers must be >= 1, got {self.max_workers}")
             
+        if self.workers < 1:
+            errors.append(f"workers must be >= 1, got {self.workers}")
+            
         return errors
         
     def log_config(self) -> None:
         """Log configuration in structured format."""
-        logger.info("=" * 60)
-        logger.info("VLA Inference Server Configuration")
-        logger.info("=" * 60)
-        logger.info(f"  Model Type:     {self.model_type}")
-        logger.info(f"  Model Path:     {self.model_path or 'default'}")
-        logger.info(f"  Device:         {self.device}")
-        logger.info(f"  Batch Size:     {self.batch_size}")
-        logger.info(f"  Chunk Size:     {self.chunk_size}")
-        logger.info(f"  gRPC Port:      {self.grpc_port}")
-        logger.info(f"  Max Workers:    {self.max_workers}")
-        logger.info(f"  Metrics:        {'enabled' if self.metrics_enabled else 'disabled'}")
-        if self.metrics_enabled:
-            logger.info(f"  Metrics Port:   {self.metrics_port}")
-        logger.info("=" * 60)
-
-
-# Singleton configuration instance
-_config: Optional[VLAConfig] = None
+        values = asdict(self)
+        values["model_path"] = self.model_path or "default"
+        values["metrics_enabled"] = "enabled" if self.metrics_enabled else "disabled"
+        template = (
+            _CFG_TEMPLATE_WITH_METRICS_PORT if self.metrics_enabled else _CFG_TEMPLATE
+        )
+        logger.info(template.format_map(values))
 
 
-def get_config() -> VLAConfig:
+def init_config() -> VLAConfig:
     """
-    Get the global configuration instance.
+    (Re)build the global configuration from the environment.
     
-    Creates from environment on first call.
+    get_config() calls this on first use; call it again only to pick
+    up environment changes.
     """
-    global _config
-    if _config is None:
-        _config = VLAConfig.from_env()
-    return _config
+    global CONFIG
+    CONFIG = VLAConfig.from_env()
+    return CONFIG
+
+
+# Global configuration, parsed on the first get_config() call rather
+# than at import, so the server configures logging first and a
+# malformed environment fails at startup instead of on import
+CONFIG: Optional[VLAConfig] = None
 
 
-def reset_config() -> None:
-    """Reset configuration (for testing)."""
-    global _config
-    _config = None
+def get_config() -> VLAConfig:
+    """
+    Get the global configuration instance, parsing it on first use.
+    
+    Raises:
+        ValueError: If an environment value cannot be parsed
+    """
+    if CONFIG is None:
+        return init_config()
+    return CONFIG
@@ -6,18 +6,26 @@
 
 import time
 import logging
-from typing import Optional
-from contextlib import contextmanager
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Latency samples buffered per label pair before they are observed
+LATENCY_FLUSH_SIZE = 64
+
+# Latency buckets optimized for VLA inference (20-200ms typical)
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.02, 0.03, 0.04, 0.05, 0.075,
+    0.1, 0.15, 0.2, 0.3, 0.5, 1.0, 2.0, 5.0
+)
+
 # Try to import prometheus_client, provide fallback if not available
 try:
     from prometheus_client import (
         Histogram,
         Counter,
         Gauge,
-        Info,
         generate_latest,
         CONTENT_TYPE_LATEST,
         CollectorRegistry,
@@ -29,6 +37,97 @@ except ImportError:
     logger.warning("prometheus_client not installed, metrics disabled")
 
 
+def _drain_latencies(buffer: Deque[float], child: 'Histogram') -> None:
+    """
+    Observe the samples currently in buffer on the histogram child.
+
+    Only as many samples as were queued on entry are taken, so writers
+    appending concurrently cannot keep the drain going.
+    """
+    for _ in range(len(buffer)):
+        try:
+            latency = buffer.popleft()
+        except IndexError:
+            # Drained concurrently by another thread or a scrape
+            return
+        child.observe(latency)
+
+
+class _LatencyScope:
+    """
+    Context manager returned by VLAMetrics.measure_latency().
+
+    Holds the pre-bound metric children so entering and exiting the
+    scope costs two clock reads, one counter increment and one deque
+    append; the latency is observed when its buffer fills or on the
+    next scrape.
+    """
+
+    __slots__ = ('_latency', '_buffer', '_success', '_error', '_start')
+
+    def __init__(self, latency, buffer, success, error):
+        self._latency = latency
+        self._buffer = buffer
+        self._success = success
+        self._error = error
+        self._start = 0
+
+    def __enter__(self) -> '_LatencyScope':
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        latency = (time.perf_counter_ns() - self._start) * 1e-9
+        if exc_type is None:
+            self._success.inc()
+        elif issubclass(exc_type, Exception):
+            self._error.inc()
+        buffer = self._buffer
+        buffer.append(latency)
+        if len(buffer) >= LATENCY_FLUSH_SIZE:
+            _drain_latencies(buffer, self._latency)
+
+
+class _LatencyFlusher:
+    """
+    Registry collector that observes all buffered latencies on scrape.
+
+    Registered ahead of the latency histogram, so every collect() of
+    the registry (generate_latest(), start_http_server()) drains the
+    buffers before the histogram is rendered. Exports no metrics itself.
+    """
+
+    __slots__ = ('_metrics',)
+
+    def __init__(self, metrics: 'VLAMetrics'):
+        self._metrics = metrics
+
+    def describe(self) -> List:
+        return []
+
+    def collect(self) -> List:
+        self._metrics.flush_latency()
+        return []
+
+
+class _NullScope:
+    """No-op latency scope used when metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullScope':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_SCOPE = _NullScope()
+
+# Values of the "status" label on vla_inference_requests_total
+_REQUEST_STATUSES = ('success', 'error')
+
+
 class VLAMetrics:
     """
     Prometheus metrics collector for VLA inference.
@@ -39,39 +138,46 @@ class VLAMetrics:
     - GPU utilization and memory
     - Batch size distribution
     - Model information
+    
+    Without prometheus_client, constructing VLAMetrics yields a
+    _DisabledMetrics whose recorders do nothing.
     """
     
+    def __new__(cls, registry: Optional['CollectorRegistry'] = None):
+        if cls is VLAMetrics and not PROMETHEUS_AVAILABLE:
+            cls = _DisabledMetrics
+        return super().__new__(cls)
+    
     def __init__(self, registry: Optional['CollectorRegistry'] = None):
         """
         Initialize metrics collectors.
 
         Args:
-            registry: Optional custom registry (for testing). If None, uses default.
+            registry: Registry to register collectors with. If None, a
+                fresh CollectorRegistry is created; the process-wide
+                default registry is never used.
         """
-        if not PROMETHEUS_AVAILABLE:
-            self._enabled = False
-            return
+        # Monotonic start time so uptime never jumps on wall-clock changes
+        self._start_mono_ns = time.monotonic_ns()
+        self._registry = registry or CollectorRegistry()
 
-        self._enabled = True
-        self._registry = registry
+        # Label-bound children keyed by label values (see bind()), and
+        # latency samples not yet observed on their histogram child
+        self._lat_cache: Dict[Tuple[str, str], 'Histogram'] = {}
+        self._lat_buffers: Dict[Tuple[str, str], Deque[float]] = {}
+        self._req_cache: Dict[Tuple[str, str], 'Counter'] = {}
+        self._batch_cache: Dict[str, 'Histogram'] = {}
 
-        # Build kwargs - only include registry if explicitly provided
-        # (passing registry=None disables registration, not passing uses default)
-        reg_kwargs = {'registry': registry} if registry is not None else {}
-
-        # Latency buckets optimized for VLA inference (20-200ms typical)
-        latency_buckets = (
-            0.005, 0.01, 0.02, 0.03, 0.04, 0.05, 0.075,
-            0.1, 0.15, 0.2, 0.3, 0.5, 1.0, 2.0, 5.0
-        )
+        # Must be registered before the latency histogram (see _LatencyFlusher)
+        self._registry.register(_LatencyFlusher(self))
 
         # Inference latency histogram
         self.inference_latency = Histogram(
             'vla_inference_latency_seconds',
             'VLA inference latency in seconds',
             ['model_type', 'embodiment'],
-            buckets=latency_buckets,
-            **reg_kwargs,
+            buckets=LATENCY_BUCKETS,
+            registry=self._registry,
         )
 
         # Request counter
@@ -79,7 +185,7 @@ class VLAMetrics:
             'vla_inference_requests_total',
             'Total VLA inference requests',
             ['model_type', 'status'],
-            **reg_kwargs,
+            registry=self._registry,
         )
         
         # Batch size histogram
@@ -88,94 +194,127 @@ class VLAMetrics:
             'Inference batch size distribution',
             ['model_type'],
             buckets=(1, 2, 4, 8, 16, 32, 64),
-            **reg_kwargs,
+            registry=self._registry,
         )
 
         # GPU metrics (gauges)
         self.gpu_utilization = Gauge(
             'vla_gpu_utilization_percent',
             'GPU utilization percentage',
-            **reg_kwargs,
+            registry=self._registry,
         )
 
         self.gpu_memory_used = Gauge(
             'vla_gpu_memory_used_bytes',
             'GPU memory used in bytes',
-            **reg_kwargs,
+            registry=self._registry,
         )
 
         self.gpu_memory_total = Gauge(
             'vla_gpu_memory_total_bytes',
             'Total GPU memory in bytes',
-            **reg_kwargs,
+            registry=self._registry,
         )
 
         # Queue metrics
         self.queue_depth = Gauge(
             'vla_queue_depth',
             'Current inference queue depth',
-            **reg_kwargs,
+            registry=self._registry,
         )
 
-        # Model info
-        self.model_info = Info(
-            'vla_model',
+        # Model info, exposed as a constant-1 gauge carrying the details as labels
+        self.model_info = Gauge(
+            'vla_model_info',
             'Currently loaded VLA model information',
-            **reg_kwargs,
+            ['model_name', 'model_version', 'base_model', 'device'],
+            registry=self._registry,
         )
 
-        # Server uptime
-        self._start_time = time.time()
+        # Server uptime, computed by prometheus_client at scrape time
         self.uptime = Gauge(
             'vla_uptime_seconds',
             'Server uptime in seconds',
-            **reg_kwargs,
+            registry=self._registry,
         )
-        
-    @contextmanager
+        self.uptime.set_function(self.get_uptime_seconds)
+
+    def bind(self, model_type: str, embodiment: str) -> None:
+        """
+        Pre-bind labelled metric children for a model/embodiment pair.
+
+        Call at model-load time so the inference path reuses the bound
+        children instead of resolving .labels() on every request.
+        Unbound pairs are bound lazily on first use.
+        """
+        # Positional label values skip the kwargs dict prometheus_client
+        # would otherwise build and reorder on every .labels() call
+        self._lat_cache[(model_type, embodiment)] = self.inference_latency.labels(
+            model_type, embodiment,
+        )
+        # Kept across rebinds so queued samples are not dropped
+        self._lat_buffers.setdefault((model_type, embodiment), deque())
+        for status in _REQUEST_STATUSES:
+            self._req_cache[(model_type, status)] = self.requests_total.labels(
+                model_type, status,
+            )
+        self._batch_cache[model_type] = self.batch_size.labels(model_type)
+
+    def _latency_child(self, model_type: str, embodiment: str) -> 'Histogram':
+        """Get the bound latency child, binding it on first use."""
+        child = self._lat_cache.get((model_type, embodiment))
+        if child is None:
+            self.bind(model_type, embodiment)
+            child = self._lat_cache[(model_type, embodiment)]
+        return child
+
     def measure_latency(self, model_type: str, embodiment: str):
         """
         Context manager to measure inference latency.
         
+        Also the single place where vla_inference_requests_total is
+        incremented: "success" on normal exit, "error" on exception.
+        The latency itself is buffered as in observe_latency().
+        
         Usage:
             with metrics.measure_latency("pi0", "unitree_h1"):
                 result = model.predict(observation)
         """
-        if not self._enabled:
-            yield
-            return
-            
-        start = time.perf_counter()
-        try:
-            yield
-            self.requests_total.labels(
-                model_type=model_type, 
-                status='success'
-            ).inc()
-        except Exception:
-            self.requests_total.labels(
-                model_type=model_type, 
-                status='error'
-            ).inc()
-            raise
-        finally:
-            latency = time.perf_counter() - start
-            self.inference_latency.labels(
-                model_type=model_type,
-                embodiment=embodiment,
-            ).observe(latency)
+        # Binding the latency child also binds both request counters
+        latency_child = self._latency_child(model_type, embodiment)
+        return _LatencyScope(
+            latency_child,
+            self._lat_buffers[(model_type, embodiment)],
+            self._req_cache[(model_type, 'success')],
+            self._req_cache[(model_type, 'error')],
+        )
+
+    def observe_latency(self, model_type: str, embodiment: str, latency_s: float) -> None:
+        """
+        Record one inference latency without counting a request.
+
+        Buffered like measure_latency(): observed on the histogram once
+        LATENCY_FLUSH_SIZE samples are queued for the label pair, or on
+        the next scrape.
+        """
+        latency_child = self._latency_child(model_type, embodiment)
+        buffer = self._lat_buffers[(model_type, embodiment)]
+        buffer.append(latency_s)
+        if len(buffer) >= LATENCY_FLUSH_SIZE:
+            _drain_latencies(buffer, latency_child)
+
+    def flush_latency(self) -> None:
+        """Observe every buffered latency sample on its histogram child."""
+        for key, buffer in list(self._lat_buffers.items()):
+            if buffer:
+                _drain_latencies(buffer, self._lat_cache[key])
             
-    def record_request(self, model_type: str, status: str) -> None:
-        """Record a request with status."""
-        if not self._enabled:
-            return
-        self.requests_total.labels(model_type=model_type, status=status).inc()
-        
     def record_batch(self, model_type: str, size: int) -> None:
         """Record batch size."""
-        if not self._enabled:
-            return
-        self.batch_size.labels(model_type=model_type).observe(size)
+        child = self._batch_cache.get(model_type)
+        if child is None:
+            child = self._batch_cache[model_type] = self.batch_size.labels(model_type)
+        child.observe(size)
         
     def update_gpu_stats(
         self,
@@ -184,16 +323,12 @@ class VLAMetrics:
         memory_total: int,
     ) -> None:
         """Update GPU metrics."""
-        if not self._enabled:
-            return
         self.gpu_utilization.set(utilization)
         self.gpu_memory_used.set(memory_used)
         self.gpu_memory_total.set(memory_total)
         
     def update_queue_depth(self, depth: int) -> None:
         """Update queue depth metric."""
-        if not self._enabled:
-            return
         self.queue_depth.set(depth)
         
     def set_model_info(
@@ -203,69 +338,134 @@ class VLAMetrics:
         base_model: str,
         device: str,
     ) -> None:
-        """Set model information."""
-        if not self._enabled:
-            return
-        self.model_info.info({
-            'model_name': model_name,
-            'model_version': model_version,
-            'base_model': base_model,
-            'device': device,
-        })
-        
-    def update_uptime(self) -> None:
-        """Update uptime metric."""
-        if not self._enabled:
-            return
-        self.uptime.set(time.time() - self._start_time)
+        """Set model information, replacing any previously loaded model."""
+        self.model_info.clear()
+        self.model_info.labels(model_name, model_version, base_model, device).set(1)
         
     def get_uptime_seconds(self) -> float:
         """Get server uptime in seconds."""
-        return time.time() - self._start_time
+        return (time.monotonic_ns() - self._start_mono_ns) * 1e-9
         
     def generate_metrics(self) -> bytes:
         """Generate Prometheus metrics output."""
-        if not self._enabled:
-            return b"# Metrics disabled\n"
-            
-        self.update_uptime()
-        if self._registry:
-            return generate_latest(self._registry)
-        return generate_latest()
+        return generate_latest(self._registry)
+
+    @property
+    def registry(self) -> Optional['CollectorRegistry']:
+        """Registry holding this instance's collectors (None if disabled)."""
+        return self._registry
         
     @property
     def content_type(self) -> str:
         """Get Prometheus content type header."""
-        if not self._enabled:
-            return "text/plain"
         return CONTENT_TYPE_LATEST
 
 
-# Global metrics instance
-_metrics: Optional[VLAMetrics] = None
+class _DisabledMetrics(VLAMetrics):
+    """
+    VLAMetrics stand-in used when prometheus_client is not installed.
+
+    Keeps the same interface; recorders do nothing, so callers need no
+    enabled check on the inference path.
+    """
+
+    def __init__(self, registry: Optional['CollectorRegistry'] = None):
+        self._start_mono_ns = time.monotonic_ns()
+
+    def bind(self, model_type: str, embodiment: str) -> None:
+        pass
+
+    def measure_latency(self, model_type: str, embodiment: str) -> _NullScope:
+        return _NULL_SCOPE
+
+    def observe_latency(self, model_type: str, embodiment: str, latency_s: float) -> None:
+        pass
+
+    def flush_latency(self) -> None:
+        pass
+
+    def record_batch(self, model_type: str, size: int) -> None:
+        pass
+
+    def update_gpu_stats(
+        self,
+        utilization: float,
+        memory_used: int,
+        memory_total: int,
+    ) -> None:
+        pass
+
+    def update_queue_depth(self, depth: int) -> None:
+        pass
+
+    def set_model_info(
+        self,
+        model_name: str,
+        model_version: str,
+        base_model: str,
+        device: str,
+    ) -> None:
+        pass
+
+    def generate_metrics(self) -> bytes:
+        return b"# Metrics disabled\n"
+
+    @property
+    def registry(self) -> None:
+        return None
+
+    @property
+    def content_type(self) -> str:
+        return "text/plain"
+
+
+def init_metrics() -> VLAMetrics:
+    """
+    (Re)create the global metrics instance.
+
+    get_metrics() calls this on first use; call it again only to start
+    from a fresh registry.
+    """
+    global METRICS
+    METRICS = VLAMetrics()
+    return METRICS
+
+
+# Global metrics instance, created on the first get_metrics() call
+# rather than at import
+METRICS: Optional[VLAMetrics] = None
 
 
 def get_metrics() -> VLAMetrics:
-    """Get global metrics instance."""
-    global _metrics
-    if _metrics is None:
-        _metrics = VLAMetrics()
-    return _metrics
+    """Get the global metrics instance, creating it on first use."""
+    if METRICS is None:
+        return init_metrics()
+    return METRICS
 
 
-def start_metrics_server(port: int = 9090) -> None:
+def start_metrics_server(
+    port: int = 9090,
+    registry: Optional['CollectorRegistry'] = None,
+) -> None:
     """
     Start Prometheus metrics HTTP server.
     
     Args:
         port: Port to serve metrics on
+        registry: Registry to expose. Defaults to the global metrics registry.
     """
     if not PROMETHEUS_AVAILABLE:
         logger.warning("Cannot start metrics server: prometheus_client not installed")
         return
         
+    if registry is None:
+        registry = get_metrics().registry
+        if registry is None:
+            logger.warning("Cannot start metrics server: metrics disabled")
+            return
+
     try:
-        start_http_server(port)
+        start_http_server(port, registry=registry)
         logger.info(f"Prometheus metrics server started on port {port}")
     except Exception as e:
         logger.error(f"Failed to start metrics server: {e}")
@@ -4,14 +4,18 @@
 @feature vla-inference
 """
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 from .base import (
+    _VLAModelBase,
     VLAModel,
     ModelInfo,
     Observation,
     Action,
     ActionChunk,
+    quantize_joints,
+    dequantize_joints,
 )
 
 if TYPE_CHECKING:
@@ -20,6 +24,16 @@ if TYPE_CHECKING:
     from .groot import GR00TModel
 
 
+# Model type -> backend module. Backends are imported only when first
+# requested; importing one registers its classes via __init_subclass__.
+_MODEL_MODULES = {
+    "pi0": ".pi0",
+    "pi0_6": ".pi0",  # Alias
+    "openvla": ".openvla",
+    "groot": ".groot",
+}
+
+
 def create_model(model_type: str) -> VLAModel:
     """
     Factory function to create VLA model instances.
@@ -33,27 +47,20 @@ def create_model(model_type: str) -> VLAModel:
     Raises:
         ValueError: If model_type is unknown
     """
-    # Import here to avoid circular imports
-    from .pi0 import Pi0Model
-    from .openvla import OpenVLAModel
-    from .groot import GR00TModel
-    
-    model_map = {
-        "pi0": Pi0Model,
-        "pi0_6": Pi0Model,  # Alias
-        "openvla": OpenVLAModel,
-        "groot": GR00TModel,
-    }
-    
     model_type_lower = model_type.lower()
-    if model_type_lower not in model_map:
-        available = ", ".join(sorted(set(model_map.keys())))
-        raise ValueError(
-            f"Unknown model type: {model_type}. "
-            f"Available: {available}"
-        )
+    model_cls = _VLAModelBase._REGISTRY.get(model_type_lower)
+    if model_cls is None:
+        module_name = _MODEL_MODULES.get(model_type_lower)
+        if module_name is None:
+            available = ", ".join(sorted(_MODEL_MODULES))
+            raise ValueError(
+                f"Unknown model type: {model_type}. "
+                f"Available: {available}"
+            )
+        import_module(module_name, __name__)
+        model_cls = _VLAModelBase._REGISTRY[model_type_lower]
     
-    return model_map[model_type_lower]()
+    return model_cls()
 
 
 __all__ = [
@@ -63,6 +70,9 @@ __all__ = [
     "Observation",
     "Action",
     "ActionChunk",
+    # Action encoding
+    "quantize_joints",
+    "dequantize_joints",
     # Factory
     "create_model",
 ]
@@ -1,43 +1,95 @@
 """
 @file base.py
-@description Abstract base class for VLA models
+@description VLA model interface and shared base class
 @feature vla-inference
 """
 
-from abc import ABC, abstractmethod
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, TYPE_CHECKING
+from functools import partial
+from typing import (
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    runtime_checkable,
+)
+
+import numpy as np
 
 if TYPE_CHECKING:
     from proto import vla_inference_pb2
 
+# Reusable chunks per thread returned by predict()/apredict()
+CHUNK_POOL_SIZE = 8
+
+# Simulated latencies drawn per refill by the stub models (power of two)
+LATENCY_POOL_SIZE = 1024
+
+# Joint vector for the stub models' cold start, copied and filled per session
+_ZERO_JOINTS = np.zeros(6)
+
 
-@dataclass
+@dataclass(slots=True)
 class ModelInfo:
-    """Model metadata for VLA inference."""
+    """
+    Model metadata for VLA inference.
+    
+    Invariants are checked in __post_init__, so every ModelInfo that
+    exists is valid; models build theirs once at class creation.
+    """
     model_name: str
     model_version: str
     action_dim: int
     chunk_size: int
-    supported_embodiments: List[str]
+    supported_embodiments: Sequence[str]
     image_width: int
     image_height: int
     base_model: str
+    
+    def __post_init__(self) -> None:
+        for name in ("model_name", "model_version", "supported_embodiments"):
+            if not getattr(self, name):
+                raise ValueError(f"ModelInfo.{name} must not be empty")
+        for name in ("action_dim", "chunk_size", "image_width", "image_height"):
+            value = getattr(self, name)
+            if value < 1:
+                raise ValueError(f"ModelInfo.{name} must be >= 1, got {value}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
-    """Robot observation input for inference."""
+    """
+    Robot observation input for inference.
+    
+    Joint state is held as contiguous float32 arrays; sequences passed
+    to the constructor are converted once in __post_init__.
+    """
     camera_image: bytes
-    joint_positions: List[float]
-    joint_velocities: List[float]
+    joint_positions: np.ndarray  # (num_joints,) float32
+    joint_velocities: np.ndarray  # (num_joints,) float32
     language_instruction: str
     timestamp: float
     embodiment_tag: str
     session_id: Optional[str] = None
+    
+    def __post_init__(self) -> None:
+        self.joint_positions = np.asarray(self.joint_positions, dtype=np.float32)
+        self.joint_velocities = np.asarray(self.joint_velocities, dtype=np.float32)
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Single timestep robot action."""
     joint_commands: List[float]
@@ -45,22 +97,75 @@ class Action:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionChunk:
-    """Predicted action sequence from VLA model."""
-    actions: List[Action]
+    """
+    Predicted action sequence from VLA model.
+    
+    Stored column-wise: row i of each array is timestep i. Arrays
+    passed to the constructor are converted once in __post_init__;
+    use .actions for per-timestep Action objects.
+    """
+    joint_commands: np.ndarray  # (chunk_size, num_joints) float32
+    gripper_commands: np.ndarray  # (chunk_size,) float32
+    timestamps: np.ndarray  # (chunk_size,) float64
     inference_time_ms: float
     model_version: str
     confidence: float
     sequence_number: int = 0
+    
+    def __post_init__(self) -> None:
+        self.joint_commands = np.asarray(self.joint_commands, dtype=np.float32)
+        self.gripper_commands = np.asarray(self.gripper_commands, dtype=np.float32)
+        self.timestamps = np.asarray(self.timestamps, dtype=np.float64)
+    
+    @property
+    def actions(self) -> List[Action]:
+        """Per-timestep view of the chunk, built on each access."""
+        return [
+            Action(
+                joint_commands=joint_commands,
+                gripper_command=gripper_command,
+                timestamp=timestamp,
+            )
+            for joint_commands, gripper_command, timestamp in zip(
+                self.joint_commands.tolist(),
+                self.gripper_commands.tolist(),
+                self.timestamps.tolist(),
+            )
+        ]
+
+
+def quantize_joints(joint_commands: np.ndarray) -> Tuple[bytes, float]:
+    """
+    Encode a (chunk_size, num_joints) trajectory as int8 with one scale.
+    
+    The scale is the chunk's absolute maximum / 127, so the largest
+    command maps to ±127. Returns (row-major int8 bytes, scale); the
+    inverse is dequantize_joints().
+    """
+    absmax = float(np.abs(joint_commands).max(initial=0.0))
+    # Rounded to float32 up front so encoder and decoder use the same value
+    scale = float(np.float32(absmax / 127.0 if absmax > 0.0 else 1.0 / 127.0))
+    quantized = np.clip(np.rint(joint_commands / scale), -127, 127).astype(np.int8)
+    return quantized.tobytes(), scale
+
+
+def dequantize_joints(data: bytes, scale: float, num_actions: int) -> np.ndarray:
+    """Decode quantize_joints() output to a (num_actions, num_joints) float32 array."""
+    joints = np.frombuffer(data, dtype=np.int8).astype(np.float32) * np.float32(scale)
+    return joints.reshape(num_actions, -1)
 
 
-class VLAModel(ABC):
+@runtime_checkable
+class VLAModel(Protocol):
     """
-    Abstract base class for Vision-Language-Action models.
+    Interface for Vision-Language-Action models.
     
     All VLA model implementations (π0.6, OpenVLA, GR00T) must
-    inherit from this class and implement all abstract methods.
+    provide these members. The interface is structural: models
+    inherit _VLAModelBase for shared state and satisfy this protocol
+    without ABCMeta instantiation checks.
     
     The interface supports:
     - Model loading/unloading for GPU memory management
@@ -68,11 +173,6 @@ class VLAModel(ABC):
     - Model metadata for client discovery
     """
     
-    _loaded: bool = False
-    _device: str = "cpu"
-    _checkpoint_path: Optional[str] = None
-    
-    @abstractmethod
     def load(self, checkpoint_path: Optional[str] = None, device: str = "cpu") -> None:
         """
         Load model weights to device.
@@ -84,9 +184,8 @@ class VLAModel(ABC):
         Raises:
             RuntimeError: If model fails to load
         """
-        pass
+        ...
     
-    @abstractmethod
     def predict(self, observation: Observation) -> ActionChunk:
         """
         Run single inference on observation.
@@ -95,14 +194,23 @@ class VLAModel(ABC):
             observation: Robot sensory state
             
         Returns:
-            ActionChunk with predicted future actions
+            ActionChunk with predicted future actions. Implementations
+            may reuse the chunk after CHUNK_POOL_SIZE further calls on
+            the same thread; copy it to keep it longer.
             
         Raises:
             RuntimeError: If model not loaded
         """
-        pass
+        ...
+    
+    async def apredict(self, observation: Observation) -> ActionChunk:
+        """
+        Run single inference without blocking the event loop.
+        
+        Same contract as predict(); used by the async gRPC servicer.
+        """
+        ...
     
-    @abstractmethod
     def predict_batch(self, observations: List[Observation]) -> List[ActionChunk]:
         """
         Run batched inference for throughput optimization.
@@ -116,9 +224,8 @@ class VLAModel(ABC):
         Raises:
             RuntimeError: If model not loaded
         """
-        pass
+        ...
     
-    @abstractmethod
     def unload(self) -> None:
         """
         Release GPU memory and cleanup resources.
@@ -126,19 +233,82 @@ class VLAModel(ABC):
         Should be called before loading a different model or
         during graceful shutdown.
         """
-        pass
+        ...
     
     @property
-    @abstractmethod
     def model_info(self) -> ModelInfo:
         """Return model metadata for client discovery."""
-        pass
+        ...
     
     @property
-    @abstractmethod
     def chunk_size(self) -> int:
         """Number of actions per chunk (e.g., 16 for π0, 8 for OpenVLA)."""
-        pass
+        ...
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Check if model is loaded and ready for inference."""
+        ...
+    
+    @property
+    def device(self) -> str:
+        """Current device model is loaded on."""
+        ...
+
+
+class _VLAModelBase:
+    """
+    Shared state and helpers for VLA model implementations.
+    
+    A plain slotted class: subclasses get loaded/device bookkeeping
+    here and implement the rest of the VLAModel protocol themselves.
+    
+    Subclasses register their model type keys at class creation:
+    
+        class MyModel(_VLAModelBase, keys=("mymodel",)):
+            ...
+    """
+    
+    # Model type key -> implementation, filled in by __init_subclass__
+    _REGISTRY: ClassVar[Dict[str, type]] = {}
+    
+    # Model configuration every subclass defines
+    MODEL_VERSION: ClassVar[str]
+    ACTION_DIM: ClassVar[int]  # Joints + gripper
+    CHUNK_SIZE: ClassVar[int]  # Actions per chunk
+    
+    # Instance state lives in slots; subclasses declare their own and
+    # must set _loaded/_device in __init__. Models using _pooled_chunk()
+    # also set _chunk_pool. The inference entry points are slots too,
+    # bound per instance by _set_loaded().
+    __slots__ = (
+        "_loaded",
+        "_device",
+        "_checkpoint_path",
+        "_chunk_pool",
+        "predict",
+        "apredict",
+        "predict_batch",
+    )
+    
+    _loaded: bool
+    _device: str
+    _checkpoint_path: Optional[str]
+    _chunk_pool: threading.local
+    predict: Callable[[Observation], ActionChunk]
+    apredict: Callable[[Observation], Awaitable[ActionChunk]]
+    predict_batch: Callable[[List[Observation]], List[ActionChunk]]
+    
+    # Implementations bound by _set_loaded(True); models that can load
+    # define them as methods. _predict_impl returns a chunk that may be
+    # reused (see VLAModel.predict), _predict_batch_impl owned chunks.
+    _predict_impl: Callable[[Observation], ActionChunk]
+    _predict_batch_impl: Callable[[List[Observation]], List[ActionChunk]]
+    
+    def __init_subclass__(cls, *, keys: Tuple[str, ...] = (), **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for key in keys:
+            _VLAModelBase._REGISTRY[key] = cls
     
     @property
     def is_loaded(self) -> bool:
@@ -150,10 +320,251 @@ class VLAModel(ABC):
         """Current device model is loaded on."""
         return self._device
     
-    def _check_loaded(self) -> None:
-        """Raise error if model not loaded."""
-        if not self._loaded:
-            raise RuntimeError(
-                f"{self.__class__.__name__} model not loaded. "
-                "Call load() before predict()."
+    def _set_loaded(self, loaded: bool) -> None:
+        """
+        Update loaded state and rebind the inference entry points.
+        
+        While unloaded, predict/apredict/predict_batch raise RuntimeError.
+        Once loaded they are bound directly to _predict_impl,
+        _apredict_impl and _predict_batch_impl, so the hot path carries
+        no loaded check.
+        """
+        self._loaded = loaded
+        if loaded:
+            self.predict = self._predict_impl
+            self.apredict = self._apredict_impl
+            self.predict_batch = self._predict_batch_impl
+        else:
+            self.predict = self.apredict = self.predict_batch = self._raise_not_loaded
+    
+    async def _apredict_impl(self, observation: Observation) -> ActionChunk:
+        """Default async inference: run _predict_impl inline (same aliasing)."""
+        return self._predict_impl(observation)
+    
+    def _initial_joints(self, observation: Observation) -> np.ndarray:
+        """
+        Starting joint vector when no previous action exists.
+        
+        Observed positions clamped to [-1, 1], truncated or zero-padded
+        to six joints.
+        """
+        current = _ZERO_JOINTS.copy()
+        start = observation.joint_positions[:6]
+        np.clip(start, -1, 1, out=current[:len(start)])
+        return current
+    
+    def _new_chunk(self) -> ActionChunk:
+        """Allocate an unfilled ActionChunk sized for this model."""
+        size = self.CHUNK_SIZE
+        return ActionChunk(
+            joint_commands=np.empty((size, self.ACTION_DIM - 1), dtype=np.float32),
+            gripper_commands=np.empty(size, dtype=np.float32),
+            timestamps=np.empty(size, dtype=np.float64),
+            inference_time_ms=0.0,
+            model_version=self.MODEL_VERSION,
+            confidence=0.0,
+        )
+    
+    def _pooled_chunk(self) -> ActionChunk:
+        """
+        Next chunk from the calling thread's ring of CHUNK_POOL_SIZE.
+        
+        Requires a threading.local in self._chunk_pool. Chunks are
+        overwritten in place once the ring wraps around.
+        """
+        pool = self._chunk_pool
+        try:
+            ring = pool.ring
+        except AttributeError:
+            ring = pool.ring = [self._new_chunk() for _ in range(CHUNK_POOL_SIZE)]
+            pool.index = 0
+        index = pool.index
+        pool.index = (index + 1) % CHUNK_POOL_SIZE
+        return ring[index]
+    
+    def _raise_not_loaded(self, *args, **kwargs) -> NoReturn:
+        """Stand-in for the inference entry points while the model is unloaded."""
+        raise RuntimeError(
+            f"{self.__class__.__name__} model not loaded. "
+            "Call load() before predict()."
+        )
+
+
+class _StubModelBase(_VLAModelBase):
+    """
+    Shared inference machinery for the CPU stub models.
+    
+    Handles simulated and measured latency, the per-thread chunk ring,
+    the sequence counter and the predict_batch thread pool. Subclasses
+    define BASE_MODEL and MIN/MAX_LATENCY_MS and implement:
+    
+    - _generate(observation, joints, grippers, timestamps): fill one
+      chunk's arrays in place; called under the state lock
+    - _calculate_confidence(observation): confidence for one chunk
+    - _reset_state(): clear trajectory state on load and unload
+    
+    load() and unload() call _start() and _stop() once their
+    backend-specific work is done.
+    """
+    
+    BASE_MODEL: ClassVar[str]
+    MIN_LATENCY_MS: ClassVar[int]
+    MAX_LATENCY_MS: ClassVar[int]
+    
+    __slots__ = (
+        "_sequence_counter",
+        "_state_lock",
+        "_executor",
+        "_simulate_latency",
+        "_measure_latency",
+        "_rng",
+        "_latency_pool",
+        "_latency_index",
+    )
+    
+    _generate: Callable[[Observation, np.ndarray, np.ndarray, np.ndarray], None]
+    _calculate_confidence: Callable[[Observation], float]
+    _reset_state: Callable[[], None]
+    
+    def __init__(self) -> None:
+        self._set_loaded(False)
+        self._device = "cpu"
+        self._checkpoint_path = None
+        self._sequence_counter = 0
+        # Serializes trajectory state updates when predict_batch runs in threads
+        self._state_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Per-thread ring of reusable output chunks (see _pooled_chunk())
+        self._chunk_pool = threading.local()
+        # Set VLA_SIMULATE_LATENCY=0 to skip the fake inference delay
+        self._simulate_latency = os.getenv("VLA_SIMULATE_LATENCY", "1") == "1"
+        # Set VLA_MEASURE_LATENCY=0 to skip timing (inference_time_ms reports 0)
+        self._measure_latency = os.getenv("VLA_MEASURE_LATENCY", "1") == "1"
+        self._rng = np.random.default_rng()
+        self._latency_pool = self._draw_latencies()
+        self._latency_index = 0
+    
+    def _start(self, checkpoint_path: Optional[str], device: str) -> None:
+        """Mark the model loaded on device and start the batch thread pool."""
+        self._checkpoint_path = checkpoint_path
+        self._device = device
+        # Default sizing (cpu_count + 4, max 32): stub work is mostly sleeping
+        self._executor = ThreadPoolExecutor(thread_name_prefix=f"{self.BASE_MODEL}-batch")
+        self._sequence_counter = 0
+        self._reset_state()
+        self._set_loaded(True)
+    
+    def _stop(self) -> None:
+        """Mark the model unloaded and shut down the batch thread pool."""
+        self._set_loaded(False)
+        # Cleared before shutdown so racing batch calls see the model unloaded
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._sequence_counter = 0
+        self._reset_state()
+    
+    def _predict_impl(self, observation: Observation, pooled: bool = True) -> ActionChunk:
+        """
+        Single inference, bound to predict() while loaded.
+        
+        With pooled=True the returned chunk comes from _pooled_chunk()
+        and its arrays are overwritten in place after CHUNK_POOL_SIZE
+        further calls on the same thread; callers that keep a chunk
+        longer must copy it. pooled=False returns a freshly allocated
+        chunk the caller owns.
+        """
+        start_ns = time.perf_counter_ns() if self._measure_latency else 0
+        
+        # Simulate inference latency
+        if self._simulate_latency:
+            time.sleep(self._sample_latency_s())
+        
+        chunk = self._pooled_chunk() if pooled else self._new_chunk()
+        return self._build_chunk(observation, start_ns, chunk)
+    
+    async def _apredict_impl(self, observation: Observation) -> ActionChunk:
+        """
+        Async variant of predict().
+        
+        The simulated latency is awaited instead of slept, so the
+        event loop keeps serving other requests meanwhile.
+        """
+        start_ns = time.perf_counter_ns() if self._measure_latency else 0
+        
+        if self._simulate_latency:
+            await asyncio.sleep(self._sample_latency_s())
+        
+        return self._build_chunk(observation, start_ns, self._pooled_chunk())
+    
+    def _predict_batch_impl(self, observations: List[Observation]) -> List[ActionChunk]:
+        """
+        Run batched inference.
+        
+        In stub mode, observations run on the model's thread pool so
+        their simulated latencies overlap; trajectory generation itself
+        is serialized. Real implementation would batch on GPU for
+        throughput.
+        """
+        executor = self._executor
+        if executor is None:
+            # unload() ran after this call was bound
+            self._raise_not_loaded()
+        
+        # Batch results outlive the per-thread chunk ring, so allocate fresh
+        predict = partial(self._predict_impl, pooled=False)
+        if not self._simulate_latency:
+            return [predict(obs) for obs in observations]
+        return list(executor.map(predict, observations))
+    
+    def _draw_latencies(self) -> np.ndarray:
+        """Draw a pool of simulated inference latencies in seconds."""
+        return self._rng.uniform(
+            self.MIN_LATENCY_MS / 1000.0,
+            self.MAX_LATENCY_MS / 1000.0,
+            LATENCY_POOL_SIZE,
+        )
+    
+    def _sample_latency_s(self) -> float:
+        """
+        Next simulated inference latency in seconds, refilling the pool on wrap.
+        
+        Called concurrently from the predict_batch pool, so the index
+        and pool are advanced under the state lock.
+        """
+        with self._state_lock:
+            index = self._latency_index
+            latency = float(self._latency_pool[index])
+            index = (index + 1) & (LATENCY_POOL_SIZE - 1)
+            if not index:
+                self._latency_pool = self._draw_latencies()
+            self._latency_index = index
+        return latency
+    
+    def _build_chunk(
+        self,
+        observation: Observation,
+        start_ns: int,
+        chunk: ActionChunk,
+    ) -> ActionChunk:
+        """Fill chunk in place with the actions for one observation."""
+        # Generate action chunk and advance the sequence counter together
+        with self._state_lock:
+            self._generate(
+                observation,
+                chunk.joint_commands,
+                chunk.gripper_commands,
+                chunk.timestamps,
             )
+            self._sequence_counter += 1
+            sequence_number = self._sequence_counter
+        
+        # Calculate actual inference time
+        inference_time_ms = (
+            (time.perf_counter_ns() - start_ns) * 1e-6 if self._measure_latency else 0.0
+        )
+        
+        chunk.inference_time_ms = inference_time_ms
+        chunk.confidence = self._calculate_confidence(observation)
+        chunk.sequence_number = sequence_number
+        return chunk
@@ -16,7 +16,7 @@ import logging
 from typing import List, Optional
 
 from .base import (
-    VLAModel,
+    _VLAModelBase,
     ModelInfo,
     Observation,
     Action,
@@ -25,6 +25,19 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+_GR00T_UNAVAILABLE_MSG = (
+    "GR00T model integration is not yet available.\n\n"
+    "GR00T is NVIDIA's foundation model for humanoid robots, "
+    "currently in limited preview.\n\n"
+    "For humanoid robot inference, please use:\n"
+    "  - model_type='pi0' for π0.6 (recommended)\n"
+    "  - model_type='openvla' for OpenVLA 7B\n\n"
+    "To track GR00T availability:\n"
+    "  https://developer.nvidia.com/project-groot\n"
+    "  https://developer.nvidia.com/isaac-sim"
+)
+_GR00T_NOT_LOADED_MSG = "GR00T model not loaded"
+
 
 class GR00TNotAvailableError(NotImplementedError):
     """
@@ -40,7 +53,7 @@ class GR00TNotAvailableError(NotImplementedError):
     pass
 
 
-class GR00TModel(VLAModel):
+class GR00TModel(_VLAModelBase, keys=("groot",)):
     """
     NVIDIA GR00T foundation model for humanoid robots (stub).
     
@@ -73,6 +86,20 @@ class GR00TModel(VLAModel):
         "unitree_g1",
     ]
     
+    # Metadata is constant, so build it once for all instances
+    _MODEL_INFO = ModelInfo(
+        model_name=MODEL_NAME,
+        model_version=MODEL_VERSION,
+        action_dim=ACTION_DIM,
+        chunk_size=CHUNK_SIZE,
+        supported_embodiments=tuple(SUPPORTED_EMBODIMENTS),
+        image_width=IMAGE_WIDTH,
+        image_height=IMAGE_HEIGHT,
+        base_model=BASE_MODEL,
+    )
+    
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize GR00T model stub."""
         self._loaded = False
@@ -86,25 +113,19 @@ class GR00TModel(VLAModel):
             GR00TNotAvailableError: Always raised in stub mode
         """
         logger.error("GR00T model is not yet available")
-        raise GR00TNotAvailableError(
-            "GR00T model integration is not yet available.\n\n"
-            "GR00T is NVIDIA's foundation model for humanoid robots, "
-            "currently in limited preview.\n\n"
-            "For humanoid robot inference, please use:\n"
-            "  - model_type='pi0' for π0.6 (recommended)\n"
-            "  - model_type='openvla' for OpenVLA 7B\n\n"
-            "To track GR00T availability:\n"
-            "  https://developer.nvidia.com/project-groot\n"
-            "  https://developer.nvidia.com/isaac-sim"
-        )
+        raise GR00TNotAvailableError(_GR00T_UNAVAILABLE_MSG)
         
     def predict(self, observation: Observation) -> ActionChunk:
         """Not implemented - see load()."""
-        raise GR00TNotAvailableError("GR00T model not loaded")
+        raise GR00TNotAvailableError(_GR00T_NOT_LOADED_MSG)
+        
+    async def apredict(self, observation: Observation) -> ActionChunk:
+        """Not implemented - see load()."""
+        raise GR00TNotAvailableError(_GR00T_NOT_LOADED_MSG)
         
     def predict_batch(self, observations: List[Observation]) -> List[ActionChunk]:
         """Not implemented - see load()."""
-        raise GR00TNotAvailableError("GR00T model not loaded")
+        raise GR00TNotAvailableError(_GR00T_NOT_LOADED_MSG)
         
     def unload(self) -> None:
         """No-op for stub."""
@@ -113,16 +134,7 @@ class GR00TModel(VLAModel):
     @property
     def model_info(self) -> ModelInfo:
         """Return expected GR00T model metadata."""
-        return ModelInfo(
-            model_name=self.MODEL_NAME,
-            model_version=self.MODEL_VERSION,
-            action_dim=self.ACTION_DIM,
-            chunk_size=self.CHUNK_SIZE,
-            supported_embodiments=self.SUPPORTED_EMBODIMENTS,
-            image_width=self.IMAGE_WIDTH,
-            image_height=self.IMAGE_HEIGHT,
-            base_model=self.BASE_MODEL,
-        )
+        return self._MODEL_INFO
         
     @property
     def chunk_size(self) -> int:
@@ -0,0 +1,30 @@
+"""
+@file jit.py
+@description Optional Numba JIT support for model kernels
+@feature vla-inference
+
+Kernels decorated with njit are compiled by Numba when it is installed
+and run as plain NumPy code otherwise, so they must stay valid in both
+modes.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Try to import numba, provide pass-through decorator if not available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba not installed, model kernels run uncompiled")
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["njit", "NUMBA_AVAILABLE"]
@@ -9,23 +9,58 @@ and use 8-bit quantization via bitsandbytes.
 """
 
 import logging
-import math
-import random
+import re
 import time
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional
+
+import numpy as np
 
 from .base import (
-    VLAModel,
+    _StubModelBase,
     ModelInfo,
     Observation,
-    Action,
-    ActionChunk,
 )
+from .jit import njit, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Instruction keyword -> base joint target, checked in order (first match wins)
+_TARGETS = {
+    "pick": np.array([0.3, 0.2, -0.4, 0.0, 0.5, 0.0]),
+    "grab": np.array([0.3, 0.2, -0.4, 0.0, 0.5, 0.0]),
+    "place": np.array([0.2, 0.3, 0.1, 0.0, 0.2, 0.0]),
+    "put": np.array([0.2, 0.3, 0.1, 0.0, 0.2, 0.0]),
+    "move": np.array([0.1, 0.1, 0.0, 0.0, 0.0, 0.0]),
+}
+_NO_TARGET = np.zeros(6)
+
+# One lookahead per _TARGETS keyword, tried in priority order at the
+# start of the instruction; the group that matched names the keyword
+_TARGET_RE = re.compile(
+    r"\A(?:" + "|".join(f"(?=.*?({keyword}))" for keyword in _TARGETS) + ")",
+    re.DOTALL,
+)
+
+
+@njit(cache=True)
+def _openvla_steps(current, target, step_sizes, pos_noise):
+    """
+    Joint trajectory stepping from current towards target.
+    
+    Each step is clamped to that row of step_sizes, perturbed by the
+    matching row of pos_noise and clamped to [-1, 1]. Returns a
+    (chunk, joints) float64 array.
+    """
+    trajectory = np.empty(step_sizes.shape)
+    for i in range(step_sizes.shape[0]):
+        step = np.minimum(np.maximum(target - current, -step_sizes[i]), step_sizes[i])
+        current = np.minimum(np.maximum(current + step + pos_noise[i], -1.0), 1.0)
+        trajectory[i] = current
+    return trajectory
 
-class OpenVLAModel(VLAModel):
+
+class OpenVLAModel(_StubModelBase, keys=("openvla",)):
     """
     OpenVLA 7B Vision-Language-Action model (CPU stub).
     
@@ -62,17 +97,31 @@ class OpenVLAModel(VLAModel):
         "google_robot",
     ]
     
+    # Metadata is constant, so build it once for all instances
+    _MODEL_INFO = ModelInfo(
+        model_name=MODEL_NAME,
+        model_version=MODEL_VERSION,
+        action_dim=ACTION_DIM,
+        chunk_size=CHUNK_SIZE,
+        supported_embodiments=tuple(SUPPORTED_EMBODIMENTS),
+        image_width=IMAGE_WIDTH,
+        image_height=IMAGE_HEIGHT,
+        base_model=BASE_MODEL,
+    )
+    
     # Simulation parameters (slightly slower than π0)
     MIN_LATENCY_MS = 30
     MAX_LATENCY_MS = 70
     
+    _STEP_TIMES = (np.arange(CHUNK_SIZE) + 1) * 0.02  # 50Hz control frequency
+    
+    __slots__ = ("_action_history",)
+    
     def __init__(self):
         """Initialize OpenVLA model stub."""
-        self._loaded = False
-        self._device = "cpu"
-        self._checkpoint_path = None
-        self._sequence_counter = 0
-        self._action_history: List[List[float]] = []
+        super().__init__()
+        # Only the last chunk's final action (6 joints + gripper) is read back
+        self._action_history: Deque[List[float]] = deque(maxlen=1)
         
     def load(self, checkpoint_path: Optional[str] = None, device: str = "cpu") -> None:
         """
@@ -96,160 +145,104 @@ class OpenVLAModel(VLAModel):
         # Simulate loading delay (real model ~30-60s with quantization)
         time.sleep(0.15)
         
-        self._checkpoint_path = checkpoint_path
-        self._device = device
-        self._loaded = True
-        self._sequence_counter = 0
-        self._action_history = []
+        # Compile the stepping kernel now rather than on the first predict
+        if NUMBA_AVAILABLE:
+            shape = (self.CHUNK_SIZE, 6)
+            _openvla_steps(np.zeros(6), _NO_TARGET, np.zeros(shape), np.zeros(shape))
         
+        self._start(checkpoint_path, device)
         logger.info("OpenVLA model loaded successfully (stub mode)")
         
-    def predict(self, observation: Observation) -> ActionChunk:
-        """
-        Run single inference with OpenVLA-style behavior.
-        
-        OpenVLA tends to produce:
-        - More discrete action changes
-        - Higher gripper action variance
-        - Slightly lower confidence on unseen embodiments
-        """
-        self._check_loaded()
-        
-        start_time = time.perf_counter()
-        
-        # Simulate inference latency (slower than π0)
-        latency_ms = random.uniform(self.MIN_LATENCY_MS, self.MAX_LATENCY_MS)
-        time.sleep(latency_ms / 1000.0)
-        
-        # Generate action chunk with OpenVLA characteristics
-        actions = self._generate_openvla_actions(observation)
-        
-        inference_time_ms = (time.perf_counter() - start_time) * 1000
-        self._sequence_counter += 1
-        
-        return ActionChunk(
-            actions=actions,
-            inference_time_ms=inference_time_ms,
-            model_version=self.MODEL_VERSION,
-            confidence=self._calculate_confidence(observation),
-            sequence_number=self._sequence_counter,
-        )
-        
-    def predict_batch(self, observations: List[Observation]) -> List[ActionChunk]:
-        """Run batched inference (sequential in stub mode)."""
-        self._check_loaded()
-        return [self.predict(obs) for obs in observations]
-        
     def unload(self) -> None:
         """Release model resources."""
         if not self._loaded:
             return
             
         logger.info("Unloading OpenVLA model")
-        self._loaded = False
-        self._sequence_counter = 0
-        self._action_history = []
+        self._stop()
         
     @property
     def model_info(self) -> ModelInfo:
         """Return OpenVLA model metadata."""
-        return ModelInfo(
-            model_name=self.MODEL_NAME,
-            model_version=self.MODEL_VERSION,
-            action_dim=self.ACTION_DIM,
-            chunk_size=self.CHUNK_SIZE,
-            supported_embodiments=self.SUPPORTED_EMBODIMENTS,
-            image_width=self.IMAGE_WIDTH,
-            image_height=self.IMAGE_HEIGHT,
-            base_model=self.BASE_MODEL,
-        )
+        return self._MODEL_INFO
         
     @property
     def chunk_size(self) -> int:
         """Return 8 actions per chunk."""
         return self.CHUNK_SIZE
         
-    def _generate_openvla_actions(self, observation: Observation) -> List[Action]:
+    def _reset_state(self) -> None:
+        """Forget the previous chunk's final action."""
+        self._action_history.clear()
+        
+    def _generate(
+        self,
+        observation: Observation,
+        joint_commands: np.ndarray,
+        gripper_commands: np.ndarray,
+        timestamps: np.ndarray,
+    ) -> None:
         """
         Generate OpenVLA-style action trajectory.
         
+        Writes one row per timestep into the joint_commands,
+        gripper_commands and timestamps arrays.
+        
         OpenVLA characteristics:
         - More step-like motion (less smooth than π0)
         - Larger discrete changes between actions
         - More aggressive gripper control
+        - Slightly lower confidence on unseen embodiments
         """
-        actions = []
-        base_time = observation.timestamp
-        dt = 0.02  # 50Hz
+        instruction = observation.language_instruction.lower()
         
-        # Get starting position
+        # Get starting position (history rows are 6 joints + gripper)
         if self._action_history:
-            current = self._action_history[-1].copy()
+            current = np.array(self._action_history[-1][:6])
         else:
-            current = [
-                max(-1, min(1, pos)) 
-                for pos in observation.joint_positions[:6]
-            ]
-            if len(current) < 6:
-                current.extend([0.0] * (6 - len(current)))
+            # Initialize from observation (normalize to [-1, 1])
+            current = self._initial_joints(observation)
         
         # Target generation (OpenVLA-style discrete targets)
         # Generate a target and move towards it
-        target = self._generate_target(observation)
+        target = self._generate_target(instruction)
         
-        for i in range(self.CHUNK_SIZE):
-            joint_commands = []
-            
-            for j, (curr, tgt) in enumerate(zip(current, target)):
-                # Step towards target with some noise
-                step_size = 0.05 + random.uniform(-0.02, 0.02)
-                if tgt > curr:
-                    new_pos = min(tgt, curr + step_size)
-                else:
-                    new_pos = max(tgt, curr - step_size)
-                    
-                # Add small noise for realism
-                new_pos += random.uniform(-0.01, 0.01)
-                new_pos = max(-1, min(1, new_pos))
-                
-                joint_commands.append(new_pos)
-                current[j] = new_pos
-            
-            # OpenVLA tends to have more binary gripper behavior
-            gripper_target = 1.0 if "pick" in observation.language_instruction.lower() else 0.0
-            gripper_current = 0.5 if not self._action_history else self._action_history[-1][6] if len(self._action_history[-1]) > 6 else 0.5
-            gripper = gripper_current + 0.15 * (gripper_target - gripper_current)
-            gripper = max(0, min(1, gripper + random.uniform(-0.05, 0.05)))
-            
-            actions.append(Action(
-                joint_commands=joint_commands,
-                gripper_command=gripper,
-                timestamp=base_time + (i + 1) * dt,
-            ))
+        # Draw all noise for the chunk up front
+        n = self.CHUNK_SIZE
+        step_sizes = 0.05 + self._rng.uniform(-0.02, 0.02, (n, 6))
+        pos_noise = self._rng.uniform(-0.01, 0.01, (n, 6))
+        grip_noise = self._rng.uniform(-0.05, 0.05, n)
         
-        # Store history
-        self._action_history.append(current + [gripper])
-        if len(self._action_history) > 10:
-            self._action_history.pop(0)
+        # Each step depends on the previous one: step towards target,
+        # add noise, clamp
+        trajectory = _openvla_steps(current, target, step_sizes, pos_noise)
+        joint_commands[:] = trajectory
+        current = trajectory[-1]
         
-        return actions
+        # OpenVLA tends to have more binary gripper behavior; target and
+        # starting point are fixed for the chunk, only the noise varies
+        gripper_target = 1.0 if "pick" in instruction else 0.0
+        gripper_current = self._action_history[-1][6] if self._action_history else 0.5
+        grippers = np.clip(
+            gripper_current + 0.15 * (gripper_target - gripper_current) + grip_noise,
+            0, 1,
+        )
+        gripper_commands[:] = grippers
         
-    def _generate_target(self, observation: Observation) -> List[float]:
-        """Generate target position based on language instruction."""
-        # Simple keyword-based target generation
-        instruction = observation.language_instruction.lower()
+        np.add(observation.timestamp, self._STEP_TIMES, out=timestamps)
+        
+        # Store history
+        self._action_history.append([*current.tolist(), float(grippers[-1])])
         
-        base = [0.0] * 6
+    def _generate_target(self, instruction: str) -> np.ndarray:
+        """Generate target position from a lowercased language instruction."""
+        # Simple keyword-based target generation; keywords found anywhere
+        # in the instruction are resolved in _TARGETS priority order
+        match = _TARGET_RE.match(instruction)
+        base = _TARGETS[match[match.lastindex]] if match and match.lastindex else _NO_TARGET
         
-        if "pick" in instruction or "grab" in instruction:
-            base = [0.3, 0.2, -0.4, 0.0, 0.5, 0.0]
-        elif "place" in instruction or "put" in instruction:
-            base = [0.2, 0.3, 0.1, 0.0, 0.2, 0.0]
-        elif "move" in instruction:
-            base = [0.1, 0.1, 0.0, 0.0, 0.0, 0.0]
-            
         # Add variation
-        return [b + random.uniform(-0.1, 0.1) for b in base]
+        return base + self._rng.uniform(-0.1, 0.1, 6)
         
     def _calculate_confidence(self, observation: Observation) -> float:
         """
@@ -262,5 +255,5 @@ class OpenVLAModel(VLAModel):
         else:
             base_confidence = 0.55
             
-        confidence = base_confidence + random.uniform(-0.05, 0.05)
+        confidence = base_confidence + self._rng.uniform(-0.05, 0.05)
         return max(0.4, min(1.0, confidence))
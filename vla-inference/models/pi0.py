@@ -8,25 +8,47 @@ When GPU support is needed, replace the inference logic with
 OpenPI library integration.
 """
 
-import asyncio
 import logging
 import math
-import random
 import time
-from typing import List, Optional
+from typing import Optional
+
+import numpy as np
 
 from .base import (
-    VLAModel,
+    _StubModelBase,
     ModelInfo,
     Observation,
-    Action,
-    ActionChunk,
 )
+from .jit import njit, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Per-joint phase offsets for the sinusoidal trajectory
+_JOINT_PHASE = np.arange(6) * 0.5
+
+
+@njit(cache=True, fastmath=True)
+def _pi0_trajectory(current, phase, joint_sin_cum, joint_cos_cum, gripper_sin, gripper_cos):
+    """
+    Joint and gripper trajectory for one chunk starting at base phase.
+    
+    Tables are the Pi0Model class attributes; see the note there.
+    Returns ((chunk, joints), (chunk,)) float64 arrays.
+    """
+    sin_phase = math.sin(phase)
+    cos_phase = math.cos(phase)
+    joints = np.clip(current + sin_phase * joint_cos_cum + cos_phase * joint_sin_cum, -1.0, 1.0)
+    
+    gripper_phase = phase * 0.3
+    grippers = np.clip(
+        0.5 + math.sin(gripper_phase) * gripper_cos + math.cos(gripper_phase) * gripper_sin,
+        0.0, 1.0,
+    )
+    return joints, grippers
+
 
-class Pi0Model(VLAModel):
+class Pi0Model(_StubModelBase, keys=("pi0", "pi0_6")):
     """
     π0.6 Vision-Language-Action model (CPU stub).
     
@@ -54,17 +76,39 @@ class Pi0Model(VLAModel):
         "aloha",
     ]
     
+    # Metadata is constant, so build it once for all instances
+    _MODEL_INFO = ModelInfo(
+        model_name=MODEL_NAME,
+        model_version=MODEL_VERSION,
+        action_dim=ACTION_DIM,
+        chunk_size=CHUNK_SIZE,
+        supported_embodiments=tuple(SUPPORTED_EMBODIMENTS),
+        image_width=IMAGE_WIDTH,
+        image_height=IMAGE_HEIGHT,
+        base_model=BASE_MODEL,
+    )
+    
     # Simulation parameters
     MIN_LATENCY_MS = 20
     MAX_LATENCY_MS = 50
     
+    # Trajectory tables. Phases advance by a fixed 0.1 per step, so with
+    # sin(b + x) = sin(b)cos(x) + cos(b)sin(x) every chunk is a linear
+    # combination of these, weighted by the sin/cos of its base phase.
+    # Joint tables are pre-accumulated along the time axis.
+    _STEP_OFFSETS = np.arange(CHUNK_SIZE) * 0.1
+    _JOINT_SIN_CUM = np.cumsum(0.02 * np.sin(_STEP_OFFSETS[:, None] + _JOINT_PHASE), axis=0)
+    _JOINT_COS_CUM = np.cumsum(0.02 * np.cos(_STEP_OFFSETS[:, None] + _JOINT_PHASE), axis=0)
+    _GRIPPER_SIN = 0.3 * np.sin(_STEP_OFFSETS * 0.3)
+    _GRIPPER_COS = 0.3 * np.cos(_STEP_OFFSETS * 0.3)
+    _STEP_TIMES = (np.arange(CHUNK_SIZE) + 1) * 0.02  # 50Hz control frequency
+    
+    __slots__ = ("_last_action",)
+    
     def __init__(self):
         """Initialize π0 model stub."""
-        self._loaded = False
-        self._device = "cpu"
-        self._checkpoint_path = None
-        self._sequence_counter = 0
-        self._last_action: Optional[List[float]] = None
+        super().__init__()
+        self._last_action: Optional[np.ndarray] = None
         
     def load(self, checkpoint_path: Optional[str] = None, device: str = "cpu") -> None:
         """
@@ -88,146 +132,87 @@ class Pi0Model(VLAModel):
         # Simulate loading delay (would be ~10-30s for real model)
         time.sleep(0.1)
         
-        self._checkpoint_path = checkpoint_path
-        self._device = device
-        self._loaded = True
-        self._sequence_counter = 0
-        self._last_action = None
-        
+        # Compile the trajectory kernel now rather than on the first predict
+        if NUMBA_AVAILABLE:
+            _pi0_trajectory(
+                np.zeros(6),
+                0.0,
+                self._JOINT_SIN_CUM,
+                self._JOINT_COS_CUM,
+                self._GRIPPER_SIN,
+                self._GRIPPER_COS,
+            )
+        
+        self._start(checkpoint_path, device)
         logger.info("π0 model loaded successfully (stub mode)")
         
-    def predict(self, observation: Observation) -> ActionChunk:
-        """
-        Run single inference on observation.
-        
-        Generates smooth, physically plausible trajectories by:
-        - Using previous action state for continuity
-        - Adding smooth sinusoidal motion patterns
-        - Respecting joint limits [-1, 1]
-        """
-        self._check_loaded()
-        
-        start_time = time.perf_counter()
-        
-        # Simulate inference latency
-        latency_ms = random.uniform(self.MIN_LATENCY_MS, self.MAX_LATENCY_MS)
-        time.sleep(latency_ms / 1000.0)
-        
-        # Generate action chunk
-        actions = self._generate_smooth_actions(observation)
-        
-        # Calculate actual inference time
-        inference_time_ms = (time.perf_counter() - start_time) * 1000
-        
-        # Update sequence counter
-        self._sequence_counter += 1
-        
-        return ActionChunk(
-            actions=actions,
-            inference_time_ms=inference_time_ms,
-            model_version=self.MODEL_VERSION,
-            confidence=self._calculate_confidence(observation),
-            sequence_number=self._sequence_counter,
-        )
-        
-    def predict_batch(self, observations: List[Observation]) -> List[ActionChunk]:
-        """
-        Run batched inference.
-        
-        In stub mode, processes sequentially. Real implementation
-        would batch on GPU for throughput.
-        """
-        self._check_loaded()
-        
-        results = []
-        for obs in observations:
-            results.append(self.predict(obs))
-        return results
-        
     def unload(self) -> None:
         """Release model resources."""
         if not self._loaded:
             return
             
         logger.info("Unloading π0 model")
-        self._loaded = False
-        self._sequence_counter = 0
-        self._last_action = None
+        self._stop()
         # In real impl: del model, torch.cuda.empty_cache()
         
     @property
     def model_info(self) -> ModelInfo:
         """Return π0 model metadata."""
-        return ModelInfo(
-            model_name=self.MODEL_NAME,
-            model_version=self.MODEL_VERSION,
-            action_dim=self.ACTION_DIM,
-            chunk_size=self.CHUNK_SIZE,
-            supported_embodiments=self.SUPPORTED_EMBODIMENTS,
-            image_width=self.IMAGE_WIDTH,
-            image_height=self.IMAGE_HEIGHT,
-            base_model=self.BASE_MODEL,
-        )
+        return self._MODEL_INFO
         
     @property
     def chunk_size(self) -> int:
         """Return 16 actions per chunk."""
         return self.CHUNK_SIZE
         
-    def _generate_smooth_actions(self, observation: Observation) -> List[Action]:
+    def _reset_state(self) -> None:
+        """Forget the previous chunk's final action."""
+        self._last_action = None
+        
+    def _generate(
+        self,
+        observation: Observation,
+        joint_commands: np.ndarray,
+        gripper_commands: np.ndarray,
+        timestamps: np.ndarray,
+    ) -> None:
         """
         Generate smooth, continuous action trajectory.
         
-        Uses sinusoidal motion patterns with:
-        - Continuity from previous actions
-        - Physically plausible velocities
-        - Action space [-1, 1]
-        """
-        actions = []
-        base_time = observation.timestamp
-        dt = 0.02  # 50Hz control frequency
+        Writes one row per timestep into the joint_commands,
+        gripper_commands and timestamps arrays.
         
+        Generates smooth, physically plausible trajectories by:
+        - Using previous action state for continuity
+        - Adding smooth sinusoidal motion patterns
+        - Respecting joint limits [-1, 1]
+        """
         # Use previous action or observation joints as starting point
         if self._last_action is not None:
-            current = self._last_action.copy()
+            current = self._last_action
         else:
             # Initialize from observation (normalize to [-1, 1])
-            current = [
-                max(-1, min(1, pos)) 
-                for pos in observation.joint_positions[:6]
-            ]
-            if len(current) < 6:
-                current.extend([0.0] * (6 - len(current)))
-        
-        # Generate trajectory with smooth motion
-        for i in range(self.CHUNK_SIZE):
-            # Time-varying perturbation for natural motion
-            phase = (self._sequence_counter * self.CHUNK_SIZE + i) * 0.1
-            
-            joint_commands = []
-            for j, curr_pos in enumerate(current):
-                # Smooth sinusoidal motion with damping
-                delta = 0.02 * math.sin(phase + j * 0.5)
-                new_pos = curr_pos + delta
-                # Clamp to valid range
-                new_pos = max(-1, min(1, new_pos))
-                joint_commands.append(new_pos)
-                current[j] = new_pos
-            
-            # Gripper: smooth transitions
-            gripper = 0.5 + 0.3 * math.sin(phase * 0.3)
-            gripper = max(0, min(1, gripper))
-            
-            actions.append(Action(
-                joint_commands=joint_commands,
-                gripper_command=gripper,
-                timestamp=base_time + (i + 1) * dt,
-            ))
+            current = self._initial_joints(observation)
+        
+        # Time-varying perturbation for natural motion: base phase of this chunk
+        phase = self._sequence_counter * self.CHUNK_SIZE * 0.1
+        
+        # Smooth sinusoidal motion, accumulated over the chunk and clamped
+        # to the valid range; gripper follows a slower sinusoid
+        trajectory, grippers = _pi0_trajectory(
+            current,
+            phase,
+            self._JOINT_SIN_CUM,
+            self._JOINT_COS_CUM,
+            self._GRIPPER_SIN,
+            self._GRIPPER_COS,
+        )
+        joint_commands[:] = trajectory
+        gripper_commands[:] = grippers
+        np.add(observation.timestamp, self._STEP_TIMES, out=timestamps)
         
         # Store last action for continuity
-        self._last_action = current
-        
-        return actions
+        self._last_action = trajectory[-1]
         
     def _calculate_confidence(self, observation: Observation) -> float:
         """
@@ -243,5 +228,5 @@ class Pi0Model(VLAModel):
             base_confidence = 0.6
             
         # Add small random variation
-        confidence = base_confidence + random.uniform(-0.05, 0.05)
+        confidence = base_confidence + self._rng.uniform(-0.05, 0.05)
         return max(0.5, min(1.0, confidence))
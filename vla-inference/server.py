@@ -8,13 +8,21 @@
 import os
 import asyncio
 import logging
+import multiprocessing
 import signal
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 import grpc
 from grpc import aio
 from dotenv import load_dotenv
 
+# libuv-based event loop (optional - falls back to the stock asyncio loop)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -27,7 +35,7 @@ except ImportError as e:
     exit(1)
 
 from servicer import VLAInferenceServicer
-from config import get_config
+from config import VLAConfig, get_config
 from metrics import start_metrics_server, get_metrics
 
 # Configure logging
@@ -38,6 +46,33 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _grpc_options(
+    config: VLAConfig,
+) -> Tuple[List[Tuple[str, Any]], Optional[grpc.Compression]]:
+    """Channel options and default response compression for the gRPC server."""
+    max_message_bytes = config.max_message_size_mb * 1024 * 1024
+    options: List[Tuple[str, Any]] = [
+        # Max message size (for images)
+        ("grpc.max_send_message_length", max_message_bytes),
+        ("grpc.max_receive_message_length", max_message_bytes),
+        # Keepalive settings
+        ("grpc.keepalive_time_ms", 10000),
+        ("grpc.keepalive_timeout_ms", 5000),
+        ("grpc.keepalive_permit_without_calls", True),
+        # HTTP/2 settings
+        ("grpc.http2.min_recv_ping_interval_without_data_ms", 5000),
+        # Let worker processes bind the same port; the kernel spreads
+        # incoming connections across them
+        ("grpc.so_reuseport", 1 if config.workers > 1 else 0),
+    ]
+    compression = None
+    if config.grpc_compression:
+        # Gzip at the lowest level (1): cheap enough for 50Hz streams
+        compression = grpc.Compression.Gzip
+        options.append(("grpc.default_compression_level", 1))
+    return options, compression
+
+
 class VLAInferenceServer:
     """
     Async gRPC server for VLA inference.
@@ -45,49 +80,44 @@ class VLAInferenceServer:
     Configuration via environment variables:
         VLA_GRPC_PORT: Server port (default: 50051)
         VLA_MAX_WORKERS: Maximum concurrent workers (default: 4)
+        VLA_WORKERS: Server processes sharing the port (default: 1)
         VLA_MODEL_PATH: Path to VLA model checkpoint (optional)
         VLA_DEVICE: Device for inference (default: cuda)
     """
 
-    def __init__(self):
+    def __init__(self, worker_index: int = 0):
         self.config = get_config()
+        self.worker_index = worker_index
         self.server: Optional[aio.Server] = None
         self.servicer: Optional[VLAInferenceServicer] = None
         self._shutdown_event = asyncio.Event()
+        self._stopping = False
 
     async def start(self) -> None:
         """Start the gRPC server."""
         self.config.log_config()
 
         # Initialize metrics before starting metrics server
-        # This ensures metrics are registered to the default registry
+        # so the HTTP endpoint serves the same registry the servicer records into
         metrics = get_metrics()
 
-        # Start metrics server if enabled
+        # Start metrics server if enabled (one port per worker process)
         if self.config.metrics_enabled:
-            start_metrics_server(self.config.metrics_port)
+            start_metrics_server(
+                self.config.metrics_port + self.worker_index, metrics.registry,
+            )
 
         # Create servicer with config (will reuse same metrics instance)
         self.servicer = VLAInferenceServicer(config=self.config)
 
         # Configure server options
-        max_message_bytes = self.config.max_message_size_mb * 1024 * 1024
-        options = [
-            # Max message size (for images)
-            ("grpc.max_send_message_length", max_message_bytes),
-            ("grpc.max_receive_message_length", max_message_bytes),
-            # Keepalive settings
-            ("grpc.keepalive_time_ms", 10000),
-            ("grpc.keepalive_timeout_ms", 5000),
-            ("grpc.keepalive_permit_without_calls", True),
-            # HTTP/2 settings
-            ("grpc.http2.min_recv_ping_interval_without_data_ms", 5000),
-        ]
+        options, compression = _grpc_options(self.config)
 
         # Create async server
         self.server = aio.server(
             options=options,
             maximum_concurrent_rpcs=self.config.max_workers * 10,
+            compression=compression,
         )
 
         # Add servicer
@@ -101,13 +131,24 @@ class VLAInferenceServer:
 
         # Start server
         await self.server.start()
-        logger.info(f"VLA Inference Server running on port {self.config.grpc_port}")
+        logger.info(
+            f"VLA Inference Server running on port {self.config.grpc_port} "
+            f"(worker {self.worker_index + 1}/{self.config.workers})"
+        )
 
         # Wait for shutdown
         await self._shutdown_event.wait()
 
     async def stop(self) -> None:
-        """Stop the gRPC server gracefully."""
+        """
+        Stop the gRPC server gracefully.
+        
+        Safe to call more than once (e.g. repeated signals); only the
+        first call shuts down.
+        """
+        if self._stopping:
+            return
+        self._stopping = True
         logger.info("Shutting down VLA Inference Server...")
 
         if self.server:
@@ -125,9 +166,15 @@ class VLAInferenceServer:
         asyncio.create_task(self.stop())
 
 
-async def main() -> None:
-    """Main entry point."""
-    server = VLAInferenceServer()
+async def main(worker_index: int = 0, managed: bool = False) -> None:
+    """
+    Main entry point for one server process.
+    
+    Managed workers (started by run_workers()) shut down on SIGTERM
+    only; SIGINT is left to the parent, which forwards it.
+    """
+    server = VLAInferenceServer(worker_index)
+    logger.info(f"Event loop: {'uvloop' if UVLOOP_AVAILABLE else 'asyncio'}")
 
     # Setup signal handlers
     loop = asyncio.get_event_loop()
@@ -136,7 +183,8 @@ async def main() -> None:
         logger.info("Received shutdown signal")
         server.request_shutdown()
 
-    for sig in (signal.SIGINT, signal.SIGTERM):
+    signals = (signal.SIGTERM,) if managed else (signal.SIGINT, signal.SIGTERM)
+    for sig in signals:
         loop.add_signal_handler(sig, signal_handler)
 
     try:
@@ -146,5 +194,61 @@ async def main() -> None:
         raise
 
 
+def run_worker(worker_index: int = 0, managed: bool = False) -> None:
+    """Run one server process until shutdown."""
+    if managed:
+        # A terminal Ctrl-C reaches the whole process group; the parent
+        # turns it into one SIGTERM per worker instead
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main(worker_index, managed))
+
+
+def run_workers(count: int) -> None:
+    """
+    Run count server processes sharing the gRPC port via SO_REUSEPORT.
+    
+    Each process loads its own model and serves metrics on
+    VLA_METRICS_PORT + its index. SIGINT/SIGTERM are forwarded to the
+    workers, which shut down gracefully.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(target=run_worker, args=(index, True), name=f"vla-worker-{index}")
+        for index in range(count)
+    ]
+    stopping = False
+
+    def forward_signal(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    # Installed before any worker starts, so a signal during startup
+    # cannot kill this process and orphan the workers already running
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, forward_signal)
+
+    for process in processes:
+        if stopping:
+            break
+        process.start()
+    if stopping:
+        # The signal may have landed mid-start(), before that worker
+        # counted as alive
+        forward_signal(None, None)
+
+    for process in processes:
+        if process.pid is not None:
+            process.join()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    workers = get_config().workers
+    if workers > 1:
+        run_workers(workers)
+    else:
+        run_worker()
@@ -7,8 +7,11 @@
 import time
 import asyncio
 import logging
+from dataclasses import replace
 from typing import AsyncIterator, Optional
 
+import numpy as np
+
 # Import generated proto code (will be generated by build script)
 try:
     from proto import vla_inference_pb2, vla_inference_pb2_grpc
@@ -24,7 +27,7 @@ try:
 except ImportError:
     HAS_PYNVML = False
 
-from models import create_model, VLAModel, Observation, ActionChunk
+from models import create_model, VLAModel, Observation, ActionChunk, quantize_joints
 from config import VLAConfig, get_config
 from metrics import get_metrics, VLAMetrics
 
@@ -73,15 +76,21 @@ class VLAInferenceServicer:
         # Initialize GPU monitoring
         self._init_gpu_monitoring()
 
-        # Set model info in metrics
+        # Set model info and pre-bind per-model metric labels
         if self._model.is_loaded:
-            info = self._model.model_info
-            self.metrics.set_model_info(
-                model_name=info.model_name,
-                model_version=info.model_version,
-                base_model=info.base_model,
-                device=self._model.device,
-            )
+            self._register_model_metrics()
+
+    def _register_model_metrics(self) -> None:
+        """Publish model info and pre-bind metric labels for the loaded model."""
+        info = self._model.model_info
+        self.metrics.set_model_info(
+            model_name=info.model_name,
+            model_version=info.model_version,
+            base_model=info.base_model,
+            device=self._model.device,
+        )
+        for embodiment in info.supported_embodiments:
+            self.metrics.bind(info.base_model, embodiment)
 
     def _create_and_load_model(self) -> VLAModel:
         """Create and load model based on configuration."""
@@ -142,8 +151,8 @@ class VLAInferenceServicer:
         """Convert proto Observation to domain Observation."""
         return Observation(
             camera_image=bytes(request.camera_image),
-            joint_positions=list(request.joint_positions),
-            joint_velocities=list(request.joint_velocities),
+            joint_positions=np.fromiter(request.joint_positions, dtype=np.float32),
+            joint_velocities=np.fromiter(request.joint_velocities, dtype=np.float32),
             language_instruction=request.language_instruction,
             timestamp=request.timestamp,
             embodiment_tag=request.embodiment_tag,
@@ -159,11 +168,31 @@ class VLAInferenceServicer:
             sequence_number=chunk.sequence_number,
         )
 
-        for action in chunk.actions:
+        if self.config.quantize_actions:
+            # Joint trajectory travels as one int8 blob; actions carry
+            # only gripper and timestamp
+            response.joints_q8, response.joint_scale = quantize_joints(
+                chunk.joint_commands,
+            )
+            for gripper_command, timestamp in zip(
+                chunk.gripper_commands.tolist(),
+                chunk.timestamps.tolist(),
+            ):
+                response.actions.append(vla_inference_pb2.Action(
+                    gripper_command=gripper_command,
+                    timestamp=timestamp,
+                ))
+            return response
+
+        for joint_commands, gripper_command, timestamp in zip(
+            chunk.joint_commands.tolist(),
+            chunk.gripper_commands.tolist(),
+            chunk.timestamps.tolist(),
+        ):
             response.actions.append(vla_inference_pb2.Action(
-                joint_commands=action.joint_commands,
-                gripper_command=action.gripper_command,
-                timestamp=action.timestamp,
+                joint_commands=joint_commands,
+                gripper_command=gripper_command,
+                timestamp=timestamp,
             ))
 
         return response
@@ -184,18 +213,22 @@ class VLAInferenceServicer:
         self.metrics.update_queue_depth(self.queue_depth)
 
         try:
-            # Convert proto to domain object
-            observation = self._observation_from_proto(request)
+            # The whole RPC runs in the metrics scope, so a request that
+            # fails in parsing or encoding is counted as an error too
+            model_type = self._model.model_info.base_model
+            with self.metrics.measure_latency(model_type, request.embodiment_tag):
+                # Convert proto to domain object
+                observation = self._observation_from_proto(request)
 
-            logger.debug(
-                f"Predict request: instruction='{observation.language_instruction}', "
-                f"embodiment={observation.embodiment_tag}"
-            )
+                logger.debug(
+                    f"Predict request: instruction='{observation.language_instruction}', "
+                    f"embodiment={observation.embodiment_tag}"
+                )
 
-            # Run inference with metrics tracking
-            model_type = self._model.model_info.base_model
-            with self.metrics.measure_latency(model_type, observation.embodiment_tag):
-                action_chunk = self._model.predict(observation)
+                action_chunk = await self._model.apredict(observation)
+
+                # Convert to proto
+                response = self._action_chunk_to_proto(action_chunk, request.timestamp)
 
             inference_time = (time.time() - start_time) * 1000
             self.total_requests += 1
@@ -205,15 +238,11 @@ class VLAInferenceServicer:
             gpu_util, mem_util, mem_used, mem_total = self._get_gpu_stats()
             self.metrics.update_gpu_stats(gpu_util, mem_used, mem_total)
 
-            # Convert to proto and return
-            return self._action_chunk_to_proto(action_chunk, request.timestamp)
+            return response
 
         except Exception as e:
+            # Request status is counted by measure_latency
             logger.error(f"Predict failed: {e}")
-            self.metrics.record_request(
-                self._model.model_info.base_model,
-                "error"
-            )
             raise
 
         finally:
@@ -244,11 +273,11 @@ class VLAInferenceServicer:
             self.metrics.update_queue_depth(self.queue_depth)
 
             try:
-                observation = self._observation_from_proto(request)
-
-                # Run inference with metrics
-                with self.metrics.measure_latency(model_type, observation.embodiment_tag):
-                    action_chunk = self._model.predict(observation)
+                # Parsing and encoding count towards the request, as in Predict
+                with self.metrics.measure_latency(model_type, request.embodiment_tag):
+                    observation = self._observation_from_proto(request)
+                    action_chunk = await self._model.apredict(observation)
+                    response = self._action_chunk_to_proto(action_chunk, request.timestamp)
 
                 inference_time = (time.time() - start_time) * 1000
                 self.total_requests += 1
@@ -260,11 +289,10 @@ class VLAInferenceServicer:
                     gpu_util, mem_util, mem_used, mem_total = self._get_gpu_stats()
                     self.metrics.update_gpu_stats(gpu_util, mem_used, mem_total)
 
-                yield self._action_chunk_to_proto(action_chunk, request.timestamp)
+                yield response
 
             except Exception as e:
                 logger.error(f"StreamControl iteration failed: {e}")
-                self.metrics.record_request(model_type, "error")
                 # Continue to next request instead of breaking
 
             finally:
@@ -318,21 +346,15 @@ class VLAInferenceServicer:
         if self._model.is_loaded:
             self._model.unload()
 
-        # Update config if new type specified
+        # Derive a new config if a different type was requested
         if model_type:
-            self.config.model_type = model_type
+            self.config = replace(self.config, model_type=model_type)
 
         # Load new model
         self._model = self._create_and_load_model()
 
         # Update metrics
-        info = self._model.model_info
-        self.metrics.set_model_info(
-            model_name=info.model_name,
-            model_version=info.model_version,
-            base_model=info.base_model,
-            device=self._model.device,
-        )
+        self._register_model_metrics()
 
         logger.info("Model reloaded successfully")
 
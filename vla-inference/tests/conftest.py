@@ -0,0 +1,95 @@
+"""
+@file conftest.py
+@description Shared pytest fixtures for VLA model tests
+@feature vla-inference
+"""
+
+import pytest
+from models import Observation
+
+
+def pytest_configure(config):
+    """Register markers so runs without pytest-xdist stay warning-free."""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run all items of a group on one pytest-xdist worker",
+    )
+
+
+# ============================================================================
+# Model Classes
+# ============================================================================
+# Backends are imported on first use, so collecting or running a subset
+# of the tests only imports the models it touches.
+
+@pytest.fixture(scope="session")
+def pi0_cls():
+    """π0 model class."""
+    from models.pi0 import Pi0Model
+    return Pi0Model
+
+
+@pytest.fixture(scope="session")
+def openvla_cls():
+    """OpenVLA model class."""
+    from models.openvla import OpenVLAModel
+    return OpenVLAModel
+
+
+@pytest.fixture(scope="session")
+def groot_cls():
+    """GR00T model class."""
+    from models.groot import GR00TModel
+    return GR00TModel
+
+
+# ============================================================================
+# Shared Model Instances
+# ============================================================================
+# Built once per session and left unloaded. Use them only in tests that
+# read metadata or hit paths that raise before changing state; tests
+# that load or predict construct their own model.
+
+@pytest.fixture(scope="session")
+def pi0_model(pi0_cls):
+    """Shared unloaded π0 model."""
+    return pi0_cls()
+
+
+@pytest.fixture(scope="session")
+def openvla_model(openvla_cls):
+    """Shared unloaded OpenVLA model."""
+    return openvla_cls()
+
+
+@pytest.fixture(scope="session")
+def groot_model(groot_cls):
+    """Shared GR00T model (never loadable)."""
+    return groot_cls()
+
+
+# ============================================================================
+# Sample Inputs
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def sample_observation():
+    """
+    Sample observation shared by all tests.
+    
+    Models only read observations; the joint arrays are made read-only
+    so an accidental in-place write fails instead of leaking into
+    later tests.
+    """
+    observation = Observation(
+        camera_image=b"fake-jpeg-data",
+        joint_positions=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+        joint_velocities=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        language_instruction="pick up the red cup",
+        timestamp=1234567890.0,
+        embodiment_tag="unitree_h1",
+        session_id="test-session",
+    )
+    observation.joint_positions.flags.writeable = False
+    observation.joint_velocities.flags.writeable = False
+    return observation
@@ -0,0 +1,139 @@
+"""
+@file test_config.py
+@description Unit tests for server configuration
+@feature vla-inference
+"""
+
+import pytest
+import config
+from config import VLAConfig, get_config, init_config
+
+
+# ============================================================================
+# Global Configuration Tests
+# ============================================================================
+
+class TestGlobalConfig:
+    """Test the global configuration accessors."""
+
+    def test_get_config_parses_on_first_use(self, monkeypatch):
+        """Test that the environment is read on the first call, then reused."""
+        monkeypatch.setattr(config, "CONFIG", None)
+        monkeypatch.setenv("VLA_MODEL_TYPE", "openvla")
+        
+        cfg = get_config()
+        
+        assert cfg.model_type == "openvla"
+        assert get_config() is cfg
+
+    def test_get_config_raises_on_malformed_env(self, monkeypatch):
+        """Test that a malformed environment fails the first call, not the import."""
+        monkeypatch.setattr(config, "CONFIG", None)
+        monkeypatch.setenv("VLA_GRPC_PORT", "not-a-port")
+        
+        with pytest.raises(ValueError):
+            get_config()
+
+    def test_init_config_sets_global(self, monkeypatch):
+        """Test that init_config() builds the config get_config() returns."""
+        monkeypatch.setattr(config, "CONFIG", None)
+        monkeypatch.setenv("VLA_MODEL_TYPE", "openvla")
+        
+        cfg = init_config()
+        
+        assert isinstance(cfg, VLAConfig)
+        assert cfg.model_type == "openvla"
+        assert get_config() is cfg
+
+
+# ============================================================================
+# Validation Tests
+# ============================================================================
+
+class TestValidation:
+    """Test VLAConfig.validate()."""
+
+    @pytest.mark.parametrize("device", ["cpu", "cuda", "cuda:0", "cuda:12"])
+    def test_valid_device(self, device):
+        """Test that cpu, cuda and cuda:N are accepted."""
+        assert VLAConfig(device=device).validate() == []
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_invalid_workers(self, workers):
+        """Test that at least one server process is required."""
+        assert VLAConfig(workers=workers).validate() == [
+            f"workers must be >= 1, got {workers}"
+        ]
+
+    @pytest.mark.parametrize("device", ["cuda:", "cuda:x", "cuda:²", "cuda:0 ", "gpu", ""])
+    def test_invalid_device(self, device):
+        """Test that malformed device strings are rejected."""
+        errors = VLAConfig(device=device).validate()
+        
+        assert len(errors) == 1
+        assert errors[0].startswith("Invalid device")
+
+
+# ============================================================================
+# Environment Parsing Tests
+# ============================================================================
+
+class TestFromEnv:
+    """Test VLAConfig.from_env() parsing."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("true", True),
+            ("True", True),
+            ("TRUE", True),
+            ("false", False),
+            ("False", False),
+            # Only "true" enables a flag
+            ("1", False),
+            ("yes", False),
+            ("", False),
+        ],
+    )
+    def test_parse_bool(self, value, expected):
+        """Test the accepted spellings of boolean flags."""
+        assert config._parse_bool(value) is expected
+
+    def test_defaults_without_env(self, monkeypatch):
+        """Test that unset variables fall back to the dataclass defaults."""
+        for _, key, _, _ in config._ENV_FIELDS:
+            monkeypatch.delenv(key, raising=False)
+        
+        assert VLAConfig.from_env() == VLAConfig()
+
+    def test_typed_values(self, monkeypatch):
+        """Test that variables are cast to their field types."""
+        monkeypatch.setenv("VLA_BATCH_SIZE", "8")
+        monkeypatch.setenv("VLA_QUANTIZE_ACTIONS", "True")
+        monkeypatch.setenv("VLA_METRICS_ENABLED", "false")
+        monkeypatch.setenv("VLA_MODEL_PATH", "/models/pi0")
+        
+        cfg = VLAConfig.from_env()
+        
+        assert cfg.batch_size == 8
+        assert cfg.quantize_actions is True
+        assert cfg.metrics_enabled is False
+        assert cfg.model_path == "/models/pi0"
+
+    @pytest.mark.parametrize("value,expected", [(None, True), ("false", False), ("TRUE", True)])
+    def test_grpc_compression(self, monkeypatch, value, expected):
+        """Test that response compression is on unless VLA_GRPC_COMPRESSION=false."""
+        if value is None:
+            monkeypatch.delenv("VLA_GRPC_COMPRESSION", raising=False)
+        else:
+            monkeypatch.setenv("VLA_GRPC_COMPRESSION", value)
+        
+        assert VLAConfig.from_env().grpc_compression is expected
+
+    @pytest.mark.parametrize("value", ["abc", "8.5", ""])
+    def test_bad_int_raises(self, monkeypatch, value):
+        """Test that a malformed integer variable raises ValueError."""
+        monkeypatch.setenv("VLA_BATCH_SIZE", value)
+        
+        with pytest.raises(ValueError):
+            VLAConfig.from_env()
@@ -0,0 +1,117 @@
+"""
+@file test_metrics.py
+@description Unit tests for Prometheus metrics
+@feature vla-inference
+"""
+
+import pytest
+import metrics
+from metrics import VLAMetrics, get_metrics, init_metrics
+
+
+# ============================================================================
+# Global Metrics Tests
+# ============================================================================
+
+class TestGlobalMetrics:
+    """Test the global metrics accessors."""
+
+    def test_get_metrics_creates_on_first_use(self, monkeypatch):
+        """Test that the instance is created on the first call, then reused."""
+        monkeypatch.setattr(metrics, "METRICS", None)
+        
+        instance = get_metrics()
+        
+        assert isinstance(instance, VLAMetrics)
+        assert get_metrics() is instance
+
+    def test_init_metrics_sets_global(self, monkeypatch):
+        """Test that init_metrics() builds the instance get_metrics() returns."""
+        monkeypatch.setattr(metrics, "METRICS", None)
+        
+        instance = init_metrics()
+        
+        assert isinstance(instance, VLAMetrics)
+        assert get_metrics() is instance
+
+
+# ============================================================================
+# Disabled Metrics Tests
+# ============================================================================
+
+class TestDisabledMetrics:
+    """Test the no-op metrics used without prometheus_client."""
+
+    def test_recorders_are_noops(self, monkeypatch):
+        """Test that every recorder works and nothing is exported."""
+        monkeypatch.setattr(metrics, "PROMETHEUS_AVAILABLE", False)
+        
+        instance = VLAMetrics()
+        instance.bind("pi0", "unitree_h1")
+        with instance.measure_latency("pi0", "unitree_h1"):
+            pass
+        instance.record_batch("pi0", 4)
+        instance.update_gpu_stats(50.0, 1, 2)
+        instance.update_queue_depth(3)
+        instance.set_model_info("pi0-stub", "0.6.0-stub", "pi0", "cpu")
+        
+        assert instance.registry is None
+        assert instance.generate_metrics() == b"# Metrics disabled\n"
+        assert instance.content_type == "text/plain"
+
+
+# ============================================================================
+# Buffered Latency Tests
+# ============================================================================
+
+class TestBufferedLatency:
+    """Test that buffered latencies export like direct observations."""
+
+    # Not a multiple of LATENCY_FLUSH_SIZE, so the scrape drains a remainder
+    SAMPLES = [0.001 * (i % 250) for i in range(3 * metrics.LATENCY_FLUSH_SIZE + 17)]
+
+    def test_buffered_matches_plain_histogram(self):
+        """Test buckets, sum and count against a directly observed Histogram."""
+        from prometheus_client import CollectorRegistry, Histogram
+        from prometheus_client.utils import floatToGoString
+        
+        instance = VLAMetrics()
+        for latency in self.SAMPLES:
+            instance.observe_latency("pi0", "unitree_h1", latency)
+        
+        plain_registry = CollectorRegistry()
+        plain = Histogram(
+            "plain_latency_seconds",
+            "Directly observed reference",
+            buckets=metrics.LATENCY_BUCKETS,
+            registry=plain_registry,
+        )
+        for latency in self.SAMPLES:
+            plain.observe(latency)
+        
+        labels = {"model_type": "pi0", "embodiment": "unitree_h1"}
+        for le in [*metrics.LATENCY_BUCKETS, float("inf")]:
+            bucket = floatToGoString(le)
+            expected = plain_registry.get_sample_value(
+                "plain_latency_seconds_bucket", {"le": bucket},
+            )
+            assert expected is not None
+            assert instance.registry.get_sample_value(
+                "vla_inference_latency_seconds_bucket", {**labels, "le": bucket},
+            ) == expected
+        assert instance.registry.get_sample_value(
+            "vla_inference_latency_seconds_count", labels,
+        ) == len(self.SAMPLES)
+        assert instance.registry.get_sample_value(
+            "vla_inference_latency_seconds_sum", labels,
+        ) == pytest.approx(plain_registry.get_sample_value("plain_latency_seconds_sum"))
+
+    def test_scrape_drains_measured_latency(self):
+        """Test a single measured request shows up in generate_metrics()."""
+        instance = VLAMetrics()
+        with instance.measure_latency("pi0", "unitree_h1"):
+            pass
+        
+        output = instance.generate_metrics().decode()
+        
+        assert 'vla_inference_latency_seconds_count{embodiment="unitree_h1",model_type="pi0"} 1.0' in output
@@ -0,0 +1,83 @@
+"""
+@file test_server.py
+@description Unit tests for the async gRPC server wrapper
+@feature vla-inference
+"""
+
+from dataclasses import replace
+
+import pytest
+
+# Generated by `make proto`; server.py exits without it
+pytest.importorskip("proto.vla_inference_pb2_grpc")
+
+import grpc
+
+from config import VLAConfig
+from server import VLAInferenceServer, _grpc_options
+
+
+# ============================================================================
+# Server Options Tests
+# ============================================================================
+
+class TestGrpcOptions:
+    """Test the options the gRPC server is created with."""
+
+    def test_compression_enabled(self):
+        """Test Gzip at the lowest level when compression is on."""
+        options, compression = _grpc_options(replace(VLAConfig(), grpc_compression=True))
+        
+        assert compression == grpc.Compression.Gzip
+        assert dict(options)["grpc.default_compression_level"] == 1
+
+    def test_compression_disabled(self):
+        """Test that no compression is configured when it is off."""
+        options, compression = _grpc_options(replace(VLAConfig(), grpc_compression=False))
+        
+        assert compression is None
+        assert "grpc.default_compression_level" not in dict(options)
+
+    @pytest.mark.parametrize("workers,reuseport", [(1, 0), (4, 1)])
+    def test_reuseport_only_with_workers(self, workers, reuseport):
+        """Test that SO_REUSEPORT is only enabled for multiple processes."""
+        options, _ = _grpc_options(replace(VLAConfig(), workers=workers))
+        
+        assert dict(options)["grpc.so_reuseport"] == reuseport
+
+    def test_message_size_limits(self):
+        """Test that message limits follow max_message_size_mb."""
+        options, _ = _grpc_options(replace(VLAConfig(), max_message_size_mb=4))
+        
+        assert dict(options)["grpc.max_send_message_length"] == 4 * 1024 * 1024
+        assert dict(options)["grpc.max_receive_message_length"] == 4 * 1024 * 1024
+
+
+# ============================================================================
+# Shutdown Tests
+# ============================================================================
+
+class _CountingServicer:
+    """Servicer stand-in that counts shutdown() calls."""
+
+    def __init__(self):
+        self.shutdowns = 0
+
+    def shutdown(self) -> None:
+        self.shutdowns += 1
+
+
+class TestServerShutdown:
+    """Test VLAInferenceServer.stop()."""
+
+    @pytest.mark.asyncio
+    async def test_stop_is_idempotent(self):
+        """Test that repeated stop() calls shut the servicer down once."""
+        server = VLAInferenceServer()
+        servicer = server.servicer = _CountingServicer()
+        
+        await server.stop()
+        await server.stop()
+        
+        assert servicer.shutdowns == 1
+        assert server._shutdown_event.is_set()
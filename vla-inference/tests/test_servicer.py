@@ -0,0 +1,141 @@
+"""
+@file test_servicer.py
+@description Unit tests for the VLA inference gRPC servicer
+@feature vla-inference
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+# Generated by `make proto`
+vla_inference_pb2 = pytest.importorskip("proto.vla_inference_pb2")
+
+from config import VLAConfig
+from metrics import VLAMetrics
+from models import dequantize_joints
+from servicer import VLAInferenceServicer
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def chunk(pi0_cls, sample_observation):
+    """One π0 action chunk, copied out of the model's chunk pool."""
+    model = pi0_cls()
+    model.load(device="cpu")
+    chunk = model.predict(sample_observation)
+    chunk = replace(
+        chunk,
+        joint_commands=chunk.joint_commands.copy(),
+        gripper_commands=chunk.gripper_commands.copy(),
+        timestamps=chunk.timestamps.copy(),
+    )
+    model.unload()
+    return chunk
+
+
+@pytest.fixture
+def servicer(monkeypatch, pi0_cls):
+    """Servicer around a loaded π0 model, with its own metrics registry."""
+    monkeypatch.setenv("VLA_SIMULATE_LATENCY", "0")
+    model = pi0_cls()
+    model.load(device="cpu")
+    servicer = VLAInferenceServicer(config=VLAConfig(), model=model)
+    servicer.metrics = VLAMetrics()
+    yield servicer
+    servicer.shutdown()
+
+
+@pytest.fixture
+def request_proto(sample_observation):
+    """Observation proto mirroring sample_observation."""
+    return vla_inference_pb2.Observation(
+        joint_positions=sample_observation.joint_positions.tolist(),
+        joint_velocities=sample_observation.joint_velocities.tolist(),
+        language_instruction=sample_observation.language_instruction,
+        timestamp=sample_observation.timestamp,
+        embodiment_tag=sample_observation.embodiment_tag,
+    )
+
+
+def _request_count(servicer, status: str) -> float:
+    """Value of vla_inference_requests_total for the π0 model and status."""
+    return servicer.metrics.registry.get_sample_value(
+        "vla_inference_requests_total", {"model_type": "pi0", "status": status},
+    )
+
+
+# ============================================================================
+# Action Chunk Encoding Tests
+# ============================================================================
+
+class TestActionChunkEncoding:
+    """Test conversion of model output to ActionChunk protos."""
+
+    @staticmethod
+    def _servicer(model, quantize_actions: bool) -> VLAInferenceServicer:
+        """Servicer around an unloaded model; only the encoder is used."""
+        config = replace(VLAConfig(), quantize_actions=quantize_actions)
+        return VLAInferenceServicer(config=config, model=model)
+
+    def test_plain_response_carries_joint_commands(self, pi0_model, chunk):
+        """Test that unquantized actions carry their joint commands."""
+        response = self._servicer(pi0_model, False)._action_chunk_to_proto(chunk, 0.0)
+        
+        assert not response.joints_q8
+        joints = np.array([action.joint_commands for action in response.actions])
+        np.testing.assert_allclose(joints, chunk.joint_commands)
+
+    def test_quantized_response_decodes_to_joint_commands(self, pi0_model, chunk):
+        """Test that the int8 trajectory decodes to the chunk's joints."""
+        response = self._servicer(pi0_model, True)._action_chunk_to_proto(chunk, 0.0)
+        
+        assert len(response.actions) == len(chunk.timestamps)
+        assert all(not action.joint_commands for action in response.actions)
+        decoded = dequantize_joints(
+            response.joints_q8, response.joint_scale, len(response.actions),
+        )
+        assert decoded.shape == chunk.joint_commands.shape
+        assert np.abs(decoded - chunk.joint_commands).max() <= response.joint_scale / 2 + 1e-6
+        
+        grippers = [action.gripper_command for action in response.actions]
+        timestamps = [action.timestamp for action in response.actions]
+        np.testing.assert_allclose(grippers, chunk.gripper_commands)
+        np.testing.assert_allclose(timestamps, chunk.timestamps)
+
+
+# ============================================================================
+# Request Metrics Tests
+# ============================================================================
+
+class TestRequestMetrics:
+    """Test that every Predict call is counted exactly once."""
+
+    @pytest.mark.asyncio
+    async def test_predict_counts_one_success(self, servicer, request_proto):
+        """Test that a successful Predict counts one success and no error."""
+        response = await servicer.Predict(request_proto, None)
+        
+        assert len(response.actions) == 16
+        assert _request_count(servicer, "success") == 1
+        assert _request_count(servicer, "error") == 0
+
+    @pytest.mark.asyncio
+    async def test_predict_encoding_failure_counts_one_error(
+        self, monkeypatch, servicer, request_proto,
+    ):
+        """Test that a failure after inference is counted as an error."""
+        def fail(chunk, base_timestamp):
+            raise ValueError("encoding failed")
+        
+        monkeypatch.setattr(servicer, "_action_chunk_to_proto", fail)
+        
+        with pytest.raises(ValueError, match="encoding failed"):
+            await servicer.Predict(request_proto, None)
+        
+        assert _request_count(servicer, "success") == 0
+        assert _request_count(servicer, "error") == 1